@@ -630,4 +630,8 @@ if __name__ == "__main__":
         log_level=settings.log_level.lower(),
         access_log=True,
         use_colors=True,
+        # Both ship with uvicorn[standard]; name them so a missing extra
+        # fails at startup instead of falling back to asyncio/h11.
+        loop="uvloop",
+        http="httptools",
     )
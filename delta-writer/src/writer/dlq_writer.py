@@ -6,6 +6,7 @@ Kafka topic for later analysis and replay.
 """
 
 import asyncio
+import base64
 import json
 import logging
 from datetime import datetime
@@ -21,6 +22,31 @@ from kafka.errors import KafkaError
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> str:
+    """Encode raw event bytes as base64 so undecodable payloads survive."""
+    if isinstance(obj, (bytes, bytearray)):
+        return base64.b64encode(obj).decode('ascii')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def read_original_event(record: Dict[str, Any]) -> Any:
+    """
+    Recover the original event from a DLQ record.
+
+    Events that could not be decoded are stored as base64 under
+    ``original_event_b64``; decoded events are stored as-is under
+    ``original_event``.
+    """
+    if "original_event_b64" in record:
+        return base64.b64decode(record["original_event_b64"])
+    return record.get("original_event")
+
+
+def _serialize_value(value: Dict[str, Any]) -> bytes:
+    """Serialize a DLQ payload for the Kafka producer."""
+    return json.dumps(value, default=_json_default).encode('utf-8')
+
+
 class DLQReason(str, Enum):
     """Reasons for routing events to DLQ"""
     MAX_RETRIES_EXCEEDED = "max_retries_exceeded"
@@ -49,11 +75,14 @@ class DLQEvent:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return asdict(self)
+        data = asdict(self)
+        if isinstance(self.original_event, (bytes, bytearray)):
+            data["original_event_b64"] = base64.b64encode(data.pop("original_event")).decode('ascii')
+        return data
 
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), default=_json_default)
 
 
 class DLQWriter:
@@ -103,7 +132,7 @@ class DLQWriter:
             try:
                 self._producer = KafkaProducer(
                     bootstrap_servers=self.bootstrap_servers,
-                    value_serializer=lambda v: json.dumps(v).encode('utf-8'),
+                    value_serializer=_serialize_value,
                     key_serializer=lambda k: k.encode('utf-8') if k else None,
                     acks='all',
                     retries=3,
@@ -205,6 +234,35 @@ class DLQWriter:
             if self.fallback_file:
                 await self._write_to_fallback(dlq_event)
 
+    async def send_dict(self, topic: str, payload: Dict[str, Any], key: Optional[str] = None):
+        """
+        Send a prebuilt DLQ payload.
+
+        The payload is handed to the producer as-is and serialized there,
+        so callers on the error path skip building a DLQEvent and encoding
+        the original event themselves. Raw ``bytes`` values are base64
+        encoded by the producer.
+
+        Args:
+            topic: DLQ topic to send to
+            payload: DLQ record, e.g. original_event, reason, error_message
+            key: Optional partitioning key
+        """
+        if not self._check_rate_limit():
+            logger.warning("DLQ rate limit exceeded, dropping event", extra={"dlq_topic": topic})
+            return
+
+        try:
+            if self._producer is None:
+                self._initialize_producer()
+
+            self._producer.send(topic=topic, value=payload, key=key)
+            self._update_metrics(payload.get("reason", DLQReason.UNHANDLED_EXCEPTION.value))
+
+        except Exception as e:
+            self.metrics["dlq_write_failures"] += 1
+            logger.error(f"Failed to write to DLQ: {e}")
+
     async def write_batch(self, dlq_events: list):
         """
         Write multiple events to DLQ.
@@ -0,0 +1,24 @@
+"""Shared pytest configuration for the test suite."""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Register suite-wide command line options."""
+    parser.addoption(
+        "--skip-slow",
+        action="store_true",
+        default=False,
+        help="Skip tests marked cdc_slow that wait on the containerized CDC pipeline",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip CDC propagation tests when running with --skip-slow."""
+    if not config.getoption("--skip-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="CDC pipeline test skipped by --skip-slow")
+    for item in items:
+        if "cdc_slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -0,0 +1,128 @@
+"""Shared fixtures for integration tests."""
+
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from filelock import FileLock
+from pymongo import MongoClient
+
+from tests.testcontainers.containers import CDCComposeStack
+
+COMPOSE_DIR = Path(__file__).parent
+
+# Touched by an xdist worker once it has brought the stack up, so the
+# controller knows to tear it down at the end of the run.
+STACK_STARTED_MARKER = "cdc_stack.started"
+
+
+def stack_state_dir(config: pytest.Config) -> Path:
+    """Get the directory the controller and xdist workers share for the stack.
+
+    Derived from the rootdir rather than a temp dir, since the controller
+    has no public handle on the basetemp its workers were given. One stack
+    per checkout matches the compose project, whose Kafka port is fixed.
+    """
+    return config.rootpath / ".pytest_cache" / "cdc_stack"
+
+
+@pytest.fixture(scope="session")
+def cdc_stack(pytestconfig):
+    """Start MongoDB, Kafka and MinIO once for the whole test session.
+
+    Under pytest-xdist every worker attaches to the same compose project:
+    workers start it one at a time behind a file lock (``docker compose up``
+    is a no-op for services already running) and the controller stops it in
+    ``pytest_sessionfinish`` after all workers are done.
+    """
+    stack = CDCComposeStack(COMPOSE_DIR)
+
+    if os.environ.get("PYTEST_XDIST_WORKER") is None:
+        stack.start()
+        yield stack
+        stack.stop()
+        return
+
+    shared_dir = stack_state_dir(pytestconfig)
+    shared_dir.mkdir(parents=True, exist_ok=True)
+    with FileLock(str(shared_dir / "cdc_stack.lock")):
+        stack.start()
+        (shared_dir / STACK_STARTED_MARKER).touch()
+    yield stack
+
+
+def pytest_sessionfinish(session):
+    """Stop the compose stack shared by xdist workers."""
+    if hasattr(session.config, "workerinput"):
+        return
+
+    marker = stack_state_dir(session.config) / STACK_STARTED_MARKER
+    if marker.exists():
+        CDCComposeStack(COMPOSE_DIR).stop()
+        marker.unlink()
+
+
+@pytest.fixture(scope="session")
+def mongo_client(cdc_stack):
+    """Get a MongoDB client shared by every test in the session.
+
+    Connection setup and topology discovery happen once; the pool keeps a
+    few warm connections so the first operation of each test does not pay
+    for a handshake.
+    """
+    client = MongoClient(
+        cdc_stack.mongodb.get_connection_string(),
+        maxPoolSize=50,
+        minPoolSize=5,
+        serverSelectionTimeoutMS=5000,
+        retryWrites=True,
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def mongodb_container(cdc_stack):
+    """MongoDB service from the shared compose stack."""
+    return cdc_stack.mongodb
+
+
+@pytest.fixture(scope="session")
+def kafka_container(cdc_stack):
+    """Kafka service from the shared compose stack."""
+    return cdc_stack.kafka
+
+
+@pytest.fixture(scope="session")
+def minio_container(cdc_stack):
+    """MinIO service from the shared compose stack."""
+    return cdc_stack.minio
+
+
+@pytest.fixture
+def test_db_name(mongo_client):
+    """Get a database name private to the test, dropped afterwards.
+
+    The MongoDB service is shared by the whole session, so tests that write
+    to fixed collection names use their own database instead.
+    """
+    name = f"test_db_{uuid4().hex}"
+    yield name
+    mongo_client.drop_database(name)
+
+
+@pytest.fixture
+def test_db(mongo_client, test_db_name):
+    """Get the test's private database on the shared MongoDB service.
+
+    The CDC pipeline captures every database, so each test's Delta tables
+    are named after its own database and never overlap with another test.
+    """
+    return mongo_client[test_db_name]
+
+
+@pytest.fixture
+def table_root():
+    """Get an S3 prefix private to the test for the Delta tables it writes."""
+    return f"s3://test-bucket/{uuid4().hex}"
@@ -0,0 +1,90 @@
+"""Helpers for reading CDC output from Delta Lake in integration tests."""
+
+import time
+from typing import Dict, List, Optional
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+from deltalake import DeltaTable
+from deltalake.exceptions import TableNotFoundError
+
+# Delta tables opened during this session, keyed by URI.
+_dt_cache: Dict[str, DeltaTable] = {}
+
+
+def get_delta_table(uri: str, storage_options: Dict[str, str]) -> DeltaTable:
+    """Open a Delta table, reusing and refreshing an earlier handle if any.
+
+    The first call for a URI reads the whole ``_delta_log``; later calls
+    only apply log entries committed since, instead of listing and
+    replaying the log from scratch on every poll.
+
+    Args:
+        uri: Delta table URI
+        storage_options: Storage options for the table's object store
+
+    Returns:
+        DeltaTable at the latest committed version
+
+    Raises:
+        TableNotFoundError: If no table exists at ``uri`` yet
+    """
+    dt = _dt_cache.get(uri)
+    if dt is None:
+        dt = DeltaTable(uri, storage_options=storage_options)
+        _dt_cache[uri] = dt
+    else:
+        dt.update_incremental()
+    return dt
+
+
+def wait_for_delta_row(
+    uri: str,
+    storage_options: Dict[str, str],
+    row_filter: ds.Expression,
+    timeout: float = 90.0,
+    interval: float = 0.5,
+    columns: Optional[List[str]] = None,
+    min_rows: int = 1,
+) -> pa.Table:
+    """Poll a Delta table until rows matching ``row_filter`` appear.
+
+    Returns as soon as CDC has flushed the expected rows instead of
+    sleeping for a fixed worst-case window. The filter and column list are
+    pushed down to the Parquet scan, so row groups and columns the test
+    does not look at are never fetched from object storage.
+
+    Args:
+        uri: Delta table URI
+        storage_options: Storage options for the table's object store
+        row_filter: Dataset expression selecting the awaited rows
+        timeout: Maximum seconds to wait
+        interval: Seconds between polls
+        columns: Columns to read (all columns if None)
+        min_rows: Number of matching rows to wait for
+
+    Returns:
+        Table of the rows matching ``row_filter``
+
+    Raises:
+        TimeoutError: If fewer than ``min_rows`` rows match within ``timeout``
+    """
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            dataset = get_delta_table(uri, storage_options).to_pyarrow_dataset()
+            matches: Optional[pa.Table] = dataset.to_table(columns=columns, filter=row_filter)
+        except TableNotFoundError:
+            matches = None
+
+        if matches is not None and len(matches) >= min_rows:
+            return matches
+
+        if time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"Expected {min_rows} matching rows in {uri} within {timeout}s, "
+                f"found {0 if matches is None else len(matches)}"
+            )
+
+        time.sleep(interval)
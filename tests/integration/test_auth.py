@@ -13,13 +13,22 @@ Tests cover:
 These tests use testcontainers to spin up a real PostgreSQL instance.
 """
 
+import os
 import pytest
 import asyncio
+import tempfile
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Dict, Any, Optional
+import base64
+import binascii
 import hashlib
 import hmac
-from jose import jwt, JWTError
+import docker
+from filelock import FileLock
+from jose import jwk, jwt, JWTError
 from testcontainers.postgres import PostgresContainer
 import psycopg2
 from psycopg2.extras import RealDictCursor
@@ -44,7 +53,25 @@ class AuthConfig:
 # ============================================================================
 
 
-def hash_password(password: str, salt: Optional[bytes] = None) -> tuple[str, str]:
+PASSWORD_HASH_SCHEME = "pbkdf2-sha256"
+
+
+def _b64encode(data: bytes) -> str:
+    """Encode bytes as unpadded standard base64, as used in PHC strings."""
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    """Decode unpadded standard base64 from a PHC string."""
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+def _derive_key(password: str, salt: bytes, iterations: int) -> bytes:
+    """Run PBKDF2-SHA256 and return the raw digest."""
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+
+
+def hash_password(password: str, salt: Optional[bytes] = None) -> str:
     """
     Hash password using PBKDF2.
 
@@ -53,38 +80,64 @@ def hash_password(password: str, salt: Optional[bytes] = None) -> tuple[str, str
         salt: Salt bytes (generated if not provided)
 
     Returns:
-        Tuple of (hashed_password_hex, salt_hex)
+        PHC-formatted hash: ``$pbkdf2-sha256$i=<iterations>$<salt>$<hash>``
     """
     if salt is None:
-        import os
         salt = os.urandom(32)
 
-    pwd_hash = hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt,
-        AuthConfig.PASSWORD_HASH_ITERATIONS,
+    pwd_hash = _derive_key(password, salt, AuthConfig.PASSWORD_HASH_ITERATIONS)
+
+    return (
+        f"${PASSWORD_HASH_SCHEME}$i={AuthConfig.PASSWORD_HASH_ITERATIONS}"
+        f"${_b64encode(salt)}${_b64encode(pwd_hash)}"
     )
 
-    return pwd_hash.hex(), salt.hex()
 
+def parse_password_hash(hashed_password: str) -> tuple[int, bytes, bytes]:
+    """
+    Split a PHC-formatted hash into its parameters.
+
+    Args:
+        hashed_password: PHC-formatted hash from hash_password
+
+    Returns:
+        Tuple of (iterations, salt, hash)
+
+    Raises:
+        ValueError: If the string is not a supported PHC hash
+    """
+    try:
+        _, scheme, params, salt, pwd_hash = hashed_password.split("$")
+        if scheme != PASSWORD_HASH_SCHEME or not params.startswith("i="):
+            raise ValueError(f"Unsupported password hash scheme: {scheme}")
+        return int(params[2:]), _b64decode(salt), _b64decode(pwd_hash)
+    except (TypeError, binascii.Error) as e:
+        raise ValueError(f"Malformed password hash: {e}") from e
 
-def verify_password(password: str, hashed_password: str, salt: str) -> bool:
+
+def verify_password(password: str, hashed_password: str) -> bool:
     """
     Verify password against hash.
 
     Args:
         password: Plain text password to verify
-        hashed_password: Hex-encoded hashed password
-        salt: Hex-encoded salt
+        hashed_password: PHC-formatted hash from hash_password
 
     Returns:
         True if password matches, False otherwise
     """
-    salt_bytes = bytes.fromhex(salt)
-    computed_hash, _ = hash_password(password, salt_bytes)
+    try:
+        iterations, salt, expected = parse_password_hash(hashed_password)
+    except ValueError:
+        return False
+
+    return hmac.compare_digest(_derive_key(password, salt, iterations), expected)
+
 
-    return hmac.compare_digest(computed_hash, hashed_password)
+# Hash verified when the username is unknown, so that a miss costs the same
+# KDF work as a wrong password and response time does not reveal which
+# usernames exist.
+_BURN_PASSWORD_HASH = hash_password("burn-password-for-unknown-users")
 
 
 # ============================================================================
@@ -92,6 +145,11 @@ def verify_password(password: str, hashed_password: str, salt: str) -> bool:
 # ============================================================================
 
 
+# Key object built once so encode/decode skip per-call key construction
+# (and, on decode, jose's attempt to parse the secret as a JWK set).
+_JWT_SIGNING_KEY = jwk.construct(AuthConfig.JWT_SECRET_KEY, AuthConfig.JWT_ALGORITHM)
+
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
     Create JWT access token.
@@ -120,7 +178,7 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
 
     encoded_jwt = jwt.encode(
         to_encode,
-        AuthConfig.JWT_SECRET_KEY,
+        _JWT_SIGNING_KEY,
         algorithm=AuthConfig.JWT_ALGORITHM,
     )
 
@@ -142,7 +200,7 @@ def decode_token(token: str) -> Dict[str, Any]:
     """
     return jwt.decode(
         token,
-        AuthConfig.JWT_SECRET_KEY,
+        _JWT_SIGNING_KEY,
         algorithms=[AuthConfig.JWT_ALGORITHM],
     )
 
@@ -161,7 +219,6 @@ def create_users_table(connection):
                 username VARCHAR(50) UNIQUE NOT NULL,
                 email VARCHAR(255) UNIQUE NOT NULL,
                 password_hash VARCHAR(256) NOT NULL,
-                password_salt VARCHAR(256) NOT NULL,
                 roles TEXT[] NOT NULL DEFAULT ARRAY['analyst'],
                 is_active BOOLEAN NOT NULL DEFAULT TRUE,
                 created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
@@ -172,6 +229,31 @@ def create_users_table(connection):
         connection.commit()
 
 
+USER_COLUMNS = (
+    "id, username, email, password_hash, roles, "
+    "is_active, created_at, updated_at, last_login"
+)
+
+
+def prepare_user_statements(connection):
+    """
+    Prepare hot-path user queries once per database session.
+
+    The users table must exist before this is called, since PostgreSQL
+    resolves column references at PREPARE time.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"PREPARE get_user_by_username (text) AS "
+            f"SELECT {USER_COLUMNS} FROM users WHERE username = $1"
+        )
+        cursor.execute(
+            "PREPARE touch_last_login (integer) AS "
+            "UPDATE users SET last_login = NOW() WHERE id = $1"
+        )
+        connection.commit()
+
+
 def create_user(
     connection,
     username: str,
@@ -195,16 +277,16 @@ def create_user(
     if roles is None:
         roles = ["analyst"]
 
-    password_hash, password_salt = hash_password(password)
+    password_hash = hash_password(password)
 
     with connection.cursor() as cursor:
         cursor.execute(
             """
-            INSERT INTO users (username, email, password_hash, password_salt, roles)
-            VALUES (%s, %s, %s, %s, %s)
+            INSERT INTO users (username, email, password_hash, roles)
+            VALUES (%s, %s, %s, %s)
             RETURNING id
             """,
-            (username, email, password_hash, password_salt, roles),
+            (username, email, password_hash, roles),
         )
         user_id = cursor.fetchone()[0]
         connection.commit()
@@ -223,14 +305,15 @@ def get_user_by_username(connection, username: str) -> Optional[Dict[str, Any]]:
     Returns:
         User dictionary or None
     """
+    # psycopg2 only speaks the text result format; timestamps are decoded by
+    # its C typecasters, and RealDictRow is already a dict, so rows are
+    # returned without a further copy.
     with connection.cursor(cursor_factory=RealDictCursor) as cursor:
         cursor.execute(
-            "SELECT * FROM users WHERE username = %s",
+            "EXECUTE get_user_by_username (%s)",
             (username,),
         )
-        result = cursor.fetchone()
-
-    return dict(result) if result else None
+        return cursor.fetchone()
 
 
 def authenticate_user(connection, username: str, password: str) -> Optional[Dict[str, Any]]:
@@ -248,18 +331,20 @@ def authenticate_user(connection, username: str, password: str) -> Optional[Dict
     user = get_user_by_username(connection, username)
 
     if not user:
+        verify_password(password, _BURN_PASSWORD_HASH)
         return None
 
     if not user["is_active"]:
         return None
 
-    if not verify_password(password, user["password_hash"], user["password_salt"]):
+    if not verify_password(password, user["password_hash"]):
         return None
 
-    # Update last login time
+    # Update last login time. The timestamp is bookkeeping, so the commit
+    # does not wait for the WAL flush; both statements go in one round trip.
     with connection.cursor() as cursor:
         cursor.execute(
-            "UPDATE users SET last_login = NOW() WHERE id = %s",
+            "SET LOCAL synchronous_commit TO OFF; EXECUTE touch_last_login (%s)",
             (user["id"],),
         )
         connection.commit()
@@ -289,32 +374,174 @@ def update_user_roles(connection, user_id: int, roles: list) -> None:
 # ============================================================================
 
 
+# Set TESTS_REUSE_DB=1 to keep the PostgreSQL container (and its schema)
+# alive between pytest runs, like Django's --reuse-db. Remove it with
+# `docker rm -f pg-tests-cache` after changing the users table definition.
+REUSE_DB = os.environ.get("TESTS_REUSE_DB") == "1"
+PG_CACHE_CONTAINER_NAME = "pg-tests-cache"
+# Shared by every pytest run on this machine, not just this session's workers
+PG_CACHE_LOCK = Path(tempfile.gettempdir()) / f"{PG_CACHE_CONTAINER_NAME}.lock"
+
+
+@dataclass(frozen=True)
+class PostgresDSN:
+    """Connection settings for the test PostgreSQL database."""
+
+    host: str
+    port: int
+    user: str
+    password: str
+    dbname: str
+
+    def connect(self, **kwargs):
+        """Open a psycopg2 connection to the database."""
+        return psycopg2.connect(
+            host=self.host,
+            port=self.port,
+            user=self.user,
+            password=self.password,
+            database=self.dbname,
+            **kwargs,
+        )
+
+
+def started_container_dsn(postgres: PostgresContainer) -> PostgresDSN:
+    """Get connection settings for a container started by testcontainers."""
+    return PostgresDSN(
+        host=postgres.get_container_host_ip(),
+        port=int(postgres.get_exposed_port(5432)),
+        user=postgres.username,
+        password=postgres.password,
+        dbname=postgres.dbname,
+    )
+
+
+def wait_for_postgres(dsn: PostgresDSN, timeout: float = 30.0, interval: float = 0.5):
+    """
+    Block until PostgreSQL accepts connections.
+
+    Raises:
+        TimeoutError: If no connection succeeds within ``timeout``
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            dsn.connect(connect_timeout=5).close()
+            return
+        except psycopg2.OperationalError as e:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"PostgreSQL not ready within {timeout}s: {e}") from e
+        time.sleep(interval)
+
+
+def attach_cached_container(postgres: PostgresContainer) -> Optional[PostgresDSN]:
+    """
+    Get connection settings for the cached container, if one exists.
+
+    The container is looked up and its port resolved through the docker
+    client, and restarted if it was stopped.
+
+    Args:
+        postgres: Unstarted container configured like the cached one
+
+    Returns:
+        Connection settings, or None if there is no cached container
+    """
+    client = postgres.get_docker_client()
+    try:
+        existing = client.client.containers.get(PG_CACHE_CONTAINER_NAME)
+    except docker.errors.NotFound:
+        return None
+
+    if existing.status != "running":
+        existing.start()
+
+    dsn = PostgresDSN(
+        host=client.host(),
+        port=int(client.port(existing.id, 5432)),
+        user=postgres.username,
+        password=postgres.password,
+        dbname=postgres.dbname,
+    )
+    wait_for_postgres(dsn)
+    return dsn
+
+
+def users_table_exists(connection) -> bool:
+    """Check whether the users table has already been created."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass('public.users') IS NOT NULL")
+        exists = cursor.fetchone()[0]
+    connection.commit()
+    return exists
+
+
 @pytest.fixture(scope="module")
 def postgres_container():
-    """Create PostgreSQL testcontainer."""
-    with PostgresContainer("postgres:15-alpine") as postgres:
-        yield postgres
+    """Create PostgreSQL testcontainer and yield its connection settings."""
+    postgres = PostgresContainer("postgres:15-alpine")
+
+    if not REUSE_DB:
+        with postgres:
+            yield started_container_dsn(postgres)
+        return
+
+    # Held until the module is done, so a concurrent run neither starts a
+    # second container under the same name nor clears rows this run uses.
+    with FileLock(str(PG_CACHE_LOCK)):
+        dsn = attach_cached_container(postgres)
+        if dsn is None:
+            postgres.with_name(PG_CACHE_CONTAINER_NAME)
+            postgres.start()
+            dsn = started_container_dsn(postgres)
+        # Left running on purpose so the next session can attach to it.
+        yield dsn
 
 
 @pytest.fixture(scope="module")
 def db_connection(postgres_container):
     """Create database connection."""
-    connection = psycopg2.connect(
-        host=postgres_container.get_container_host_ip(),
-        port=postgres_container.get_exposed_port(5432),
-        user=postgres_container.username,
-        password=postgres_container.password,
-        database=postgres_container.dbname,
-    )
+    connection = postgres_container.connect()
 
-    # Create users table
-    create_users_table(connection)
+    # Create users table, or clear rows left behind by an aborted run
+    if users_table_exists(connection):
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM users")
+        connection.commit()
+    else:
+        create_users_table(connection)
+    prepare_user_statements(connection)
 
     yield connection
 
     connection.close()
 
 
+SAMPLE_USERNAME = "sampleuser"
+
+
+@pytest.fixture(scope="class")
+def sample_user(db_connection):
+    """
+    Create and authenticate one admin user shared by a test class.
+
+    Only the returned row is shared: cleanup_users still empties the table
+    after each test, so consumers must not look the user up again.
+
+    Returns:
+        Tuple of (user_dict, password)
+    """
+    password = "SamplePass123!"
+    create_user(
+        db_connection,
+        SAMPLE_USERNAME,
+        "sample@example.com",
+        password,
+        roles=["admin"],
+    )
+    return authenticate_user(db_connection, SAMPLE_USERNAME, password), password
+
+
 @pytest.fixture(autouse=True)
 def cleanup_users(db_connection):
     """Clean up users table before each test."""
@@ -338,11 +565,11 @@ class TestPasswordHashing:
         """Test that hashing same password twice generates different salts."""
         password = "MySecurePassword123!"
 
-        hash1, salt1 = hash_password(password)
-        hash2, salt2 = hash_password(password)
+        hash1 = hash_password(password)
+        hash2 = hash_password(password)
 
         # Salts should be different
-        assert salt1 != salt2
+        assert parse_password_hash(hash1)[1] != parse_password_hash(hash2)[1]
         # Hashes should be different (due to different salts)
         assert hash1 != hash2
 
@@ -350,8 +577,9 @@ class TestPasswordHashing:
         """Test that hashing with same salt produces same hash."""
         password = "MySecurePassword123!"
 
-        hash1, salt1 = hash_password(password)
-        hash2, _ = hash_password(password, bytes.fromhex(salt1))
+        hash1 = hash_password(password)
+        _, salt1, _ = parse_password_hash(hash1)
+        hash2 = hash_password(password, salt1)
 
         # Hashes should be the same
         assert hash1 == hash2
@@ -359,25 +587,25 @@ class TestPasswordHashing:
     def test_verify_password_with_correct_password(self):
         """Test password verification with correct password."""
         password = "CorrectPassword123!"
-        password_hash, salt = hash_password(password)
+        password_hash = hash_password(password)
 
-        assert verify_password(password, password_hash, salt) is True
+        assert verify_password(password, password_hash) is True
 
     def test_verify_password_with_incorrect_password(self):
         """Test password verification with incorrect password."""
         correct_password = "CorrectPassword123!"
         wrong_password = "WrongPassword456!"
 
-        password_hash, salt = hash_password(correct_password)
+        password_hash = hash_password(correct_password)
 
-        assert verify_password(wrong_password, password_hash, salt) is False
+        assert verify_password(wrong_password, password_hash) is False
 
     def test_verify_password_case_sensitive(self):
         """Test password verification is case sensitive."""
         password = "CaseSensitive123!"
-        password_hash, salt = hash_password(password)
+        password_hash = hash_password(password)
 
-        assert verify_password("casesensitive123!", password_hash, salt) is False
+        assert verify_password("casesensitive123!", password_hash) is False
 
 
 class TestUserCreation:
@@ -431,8 +659,9 @@ class TestUserCreation:
 
         # Password hash should not match plain text
         assert user["password_hash"] != password
-        # Password hash should be hex string
-        assert len(user["password_hash"]) == 64  # SHA-256 hex is 64 chars
+        # Password hash should be a PHC string carrying its own salt
+        assert user["password_hash"].startswith(f"${PASSWORD_HASH_SCHEME}$")
+        assert len(parse_password_hash(user["password_hash"])[2]) == 32  # SHA-256 digest
 
     def test_create_duplicate_username_fails(self, db_connection):
         """Test creating user with duplicate username fails."""
@@ -507,6 +736,19 @@ class TestUserAuthentication:
 
         assert user is None
 
+    def test_authenticate_nonexistent_user_still_runs_kdf(self, db_connection, monkeypatch):
+        """Test unknown usernames pay the same KDF cost as wrong passwords."""
+        verified = []
+
+        def tracking_verify(password, hashed_password):
+            verified.append(hashed_password)
+            return verify_password(password, hashed_password)
+
+        monkeypatch.setattr(f"{__name__}.verify_password", tracking_verify)
+
+        assert authenticate_user(db_connection, "nonexistent", "SomePass123!") is None
+        assert verified == [_BURN_PASSWORD_HASH]
+
     def test_authenticate_updates_last_login(self, db_connection):
         """Test authentication updates last login timestamp."""
         username = "loginuser"
@@ -546,13 +788,9 @@ class TestUserAuthentication:
 class TestJWTTokenGeneration:
     """Integration tests for JWT token generation."""
 
-    def test_generate_token_for_authenticated_user(self, db_connection):
+    def test_generate_token_for_authenticated_user(self, sample_user):
         """Test generating JWT token for authenticated user."""
-        username = "tokenuser"
-        password = "TokenPass123!"
-
-        create_user(db_connection, username, "token@example.com", password)
-        user = authenticate_user(db_connection, username, password)
+        user, _ = sample_user
 
         assert user is not None
 
@@ -567,20 +805,10 @@ class TestJWTTokenGeneration:
         assert isinstance(token, str)
         assert token.count(".") == 2  # JWT has 3 parts
 
-    def test_token_contains_user_claims(self, db_connection):
+    def test_token_contains_user_claims(self, sample_user):
         """Test JWT token contains user claims."""
-        username = "claimsuser"
-        password = "ClaimsPass123!"
+        user, _ = sample_user
 
-        user_id = create_user(
-            db_connection,
-            username,
-            "claims@example.com",
-            password,
-            roles=["admin"],
-        )
-
-        user = authenticate_user(db_connection, username, password)
         token = create_access_token({
             "sub": str(user["id"]),
             "username": user["username"],
@@ -590,19 +818,15 @@ class TestJWTTokenGeneration:
         # Decode token
         payload = decode_token(token)
 
-        assert payload["sub"] == str(user_id)
-        assert payload["username"] == username
+        assert payload["sub"] == str(user["id"])
+        assert payload["username"] == SAMPLE_USERNAME
         assert "admin" in payload["roles"]
         assert "exp" in payload
         assert "iat" in payload
 
-    def test_token_expiration(self, db_connection):
+    def test_token_expiration(self, sample_user):
         """Test JWT token expires after configured time."""
-        username = "expireuser"
-        password = "ExpirePass123!"
-
-        create_user(db_connection, username, "expire@example.com", password)
-        user = authenticate_user(db_connection, username, password)
+        user, _ = sample_user
 
         # Create token that expires in 1 second
         token = create_access_token(
@@ -718,13 +942,9 @@ class TestCompleteLoginFlow:
 class TestTokenValidation:
     """Integration tests for JWT token validation."""
 
-    def test_validate_token_with_correct_secret(self, db_connection):
+    def test_validate_token_with_correct_secret(self, sample_user):
         """Test validating token with correct secret."""
-        username = "validtoken"
-        password = "ValidToken123!"
-
-        create_user(db_connection, username, "valid@example.com", password)
-        user = authenticate_user(db_connection, username, password)
+        user, _ = sample_user
 
         token = create_access_token({"sub": str(user["id"])})
 
@@ -732,13 +952,9 @@ class TestTokenValidation:
         payload = decode_token(token)
         assert payload["sub"] == str(user["id"])
 
-    def test_validate_token_with_wrong_secret_fails(self, db_connection):
+    def test_validate_token_with_wrong_secret_fails(self, sample_user):
         """Test validating token with wrong secret fails."""
-        username = "wrongsecret"
-        password = "WrongSecret123!"
-
-        create_user(db_connection, username, "wrong@example.com", password)
-        user = authenticate_user(db_connection, username, password)
+        user, _ = sample_user
 
         token = create_access_token({"sub": str(user["id"])})
 
@@ -746,13 +962,9 @@ class TestTokenValidation:
         with pytest.raises(JWTError):
             jwt.decode(token, "wrong-secret-key", algorithms=[AuthConfig.JWT_ALGORITHM])
 
-    def test_validate_expired_token_fails(self, db_connection):
+    def test_validate_expired_token_fails(self, sample_user):
         """Test validating expired token fails."""
-        username = "expiredtoken"
-        password = "ExpiredToken123!"
-
-        create_user(db_connection, username, "expired@example.com", password)
-        user = authenticate_user(db_connection, username, password)
+        user, _ = sample_user
 
         # Create token that expired 1 hour ago
         token = create_access_token(
@@ -764,13 +976,9 @@ class TestTokenValidation:
         with pytest.raises(JWTError):
             decode_token(token)
 
-    def test_validate_tampered_token_fails(self, db_connection):
+    def test_validate_tampered_token_fails(self, sample_user):
         """Test validating tampered token fails."""
-        username = "tampered"
-        password = "Tampered123!"
-
-        create_user(db_connection, username, "tampered@example.com", password)
-        user = authenticate_user(db_connection, username, password)
+        user, _ = sample_user
 
         token = create_access_token({"sub": str(user["id"])})
 
@@ -3,58 +3,10 @@
 import pytest
 import time
 from datetime import datetime
-from pymongo import MongoClient
 from deltalake import DeltaTable
 import pyarrow.compute as pc
 
-from tests.testcontainers.containers import (
-    MongoDBContainer,
-    KafkaContainer,
-    MinIOContainer,
-)
-
-
-@pytest.fixture(scope="module")
-def mongodb_container():
-    """Start MongoDB container."""
-    container = MongoDBContainer()
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture(scope="module")
-def kafka_container():
-    """Start Kafka container."""
-    container = KafkaContainer()
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture(scope="module")
-def minio_container():
-    """Start MinIO container."""
-    container = MinIOContainer()
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture
-def mongo_client(mongodb_container):
-    """Get MongoDB client."""
-    client = MongoClient(mongodb_container.get_connection_string())
-    yield client
-    client.close()
-
-
-@pytest.fixture
-def test_db(mongo_client):
-    """Get test database."""
-    db = mongo_client["testdb"]
-    yield db
-    mongo_client.drop_database("testdb")
+pytestmark = pytest.mark.cdc_slow
 
 
 def test_delete_document_replicates_to_delta(
@@ -92,7 +44,7 @@ def test_delete_document_replicates_to_delta(
     time.sleep(60)
 
     storage_options = minio_container.get_storage_options()
-    table_uri = "s3://lakehouse/tables/testdb_sessions"
+    table_uri = f"s3://lakehouse/tables/{test_db.name}_sessions"
 
     try:
         delta_table = DeltaTable(table_uri, storage_options=storage_options)
@@ -130,14 +82,11 @@ def test_bulk_delete_replicates(
     """
     collection = test_db["temp_data"]
 
-    documents = []
-    for i in range(20):
-        doc = {
-            "_id": f"temp_{i:03d}",
-            "data": f"value_{i}",
-            "created_at": datetime.now()
-        }
-        documents.append(doc)
+    now = datetime.now()
+    documents = [
+        {"_id": f"temp_{i:03d}", "data": f"value_{i}", "created_at": now}
+        for i in range(20)
+    ]
 
     collection.insert_many(documents)
     print(f"Inserted {len(documents)} documents")
@@ -150,7 +99,7 @@ def test_bulk_delete_replicates(
     time.sleep(60)
 
     storage_options = minio_container.get_storage_options()
-    table_uri = "s3://lakehouse/tables/testdb_temp_data"
+    table_uri = f"s3://lakehouse/tables/{test_db.name}_temp_data"
 
     try:
         delta_table = DeltaTable(table_uri, storage_options=storage_options)
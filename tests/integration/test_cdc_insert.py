@@ -1,60 +1,12 @@
 """Integration test for MongoDB insert -> Delta Lake replication."""
 
 import pytest
-import time
 from datetime import datetime
-from pymongo import MongoClient
-from deltalake import DeltaTable
-import pyarrow.compute as pc
+import pyarrow.dataset as ds
 
-from tests.testcontainers.containers import (
-    MongoDBContainer,
-    KafkaContainer,
-    MinIOContainer,
-)
+from tests.integration.delta_utils import wait_for_delta_row
 
-
-@pytest.fixture(scope="module")
-def mongodb_container():
-    """Start MongoDB container."""
-    container = MongoDBContainer()
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture(scope="module")
-def kafka_container():
-    """Start Kafka container."""
-    container = KafkaContainer()
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture(scope="module")
-def minio_container():
-    """Start MinIO container."""
-    container = MinIOContainer()
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture
-def mongo_client(mongodb_container):
-    """Get MongoDB client."""
-    client = MongoClient(mongodb_container.get_connection_string())
-    yield client
-    client.close()
-
-
-@pytest.fixture
-def test_db(mongo_client):
-    """Get test database."""
-    db = mongo_client["testdb"]
-    yield db
-    mongo_client.drop_database("testdb")
+pytestmark = pytest.mark.cdc_slow
 
 
 def test_insert_document_replicates_to_delta(
@@ -90,20 +42,16 @@ def test_insert_document_replicates_to_delta(
     collection.insert_one(test_document)
     print(f"Inserted document with _id: {test_document['_id']}")
 
-    time.sleep(60)
-
     storage_options = minio_container.get_storage_options()
-    table_uri = "s3://lakehouse/tables/testdb_users"
+    table_uri = f"s3://lakehouse/tables/{test_db.name}_users"
 
     try:
-        delta_table = DeltaTable(table_uri, storage_options=storage_options)
-        df = delta_table.to_pyarrow_table()
-
-        print(f"Delta table records: {len(df)}")
-        print(f"Schema: {df.schema}")
-
-        id_filter = pc.equal(df["_id"], test_document["_id"])
-        filtered_df = df.filter(id_filter)
+        filtered_df = wait_for_delta_row(
+            table_uri,
+            storage_options,
+            ds.field("_id") == test_document["_id"],
+            columns=["_id", "name", "email", "age", "active", "_cdc_operation"],
+        )
 
         assert len(filtered_df) == 1, f"Expected 1 record, found {len(filtered_df)}"
 
@@ -136,35 +84,36 @@ def test_batch_insert_replicates(
     """
     collection = test_db["orders"]
 
-    documents = []
-    for i in range(100):
-        doc = {
+    now = datetime.now()
+    documents = [
+        {
             "_id": f"order_{i:03d}",
             "user_id": f"user_{i % 10}",
             "amount": 100.0 + i,
             "status": "pending",
-            "created_at": datetime.now()
+            "created_at": now
         }
-        documents.append(doc)
+        for i in range(100)
+    ]
 
-    result = collection.insert_many(documents)
+    # Documents are independent, so let the server apply them unordered.
+    result = collection.insert_many(documents, ordered=False)
     print(f"Inserted {len(result.inserted_ids)} documents")
 
-    time.sleep(60)
-
     storage_options = minio_container.get_storage_options()
-    table_uri = "s3://lakehouse/tables/testdb_orders"
+    table_uri = f"s3://lakehouse/tables/{test_db.name}_orders"
 
     try:
-        delta_table = DeltaTable(table_uri, storage_options=storage_options)
-        df = delta_table.to_pyarrow_table()
-
-        print(f"Delta table records: {len(df)}")
+        insert_df = wait_for_delta_row(
+            table_uri,
+            storage_options,
+            ds.field("_cdc_operation") == "insert",
+            columns=["_id", "_cdc_operation"],
+            min_rows=100,
+        )
 
-        assert len(df) >= 100, f"Expected at least 100 records, found {len(df)}"
+        print(f"Delta table insert records: {len(insert_df)}")
 
-        insert_filter = pc.equal(df["_cdc_operation"], "insert")
-        insert_df = df.filter(insert_filter)
         assert len(insert_df) >= 100, f"Expected at least 100 inserts, found {len(insert_df)}"
 
         print("Test passed: Batch insert successfully replicated to Delta Lake")
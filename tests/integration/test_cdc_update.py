@@ -1,60 +1,14 @@
 """Integration test for MongoDB update -> Delta Lake replication."""
 
 import pytest
-import time
 from datetime import datetime
-from pymongo import MongoClient
-from deltalake import DeltaTable
+from pymongo import UpdateOne
 import pyarrow.compute as pc
+import pyarrow.dataset as ds
 
-from tests.testcontainers.containers import (
-    MongoDBContainer,
-    KafkaContainer,
-    MinIOContainer,
-)
+from tests.integration.delta_utils import wait_for_delta_row
 
-
-@pytest.fixture(scope="module")
-def mongodb_container():
-    """Start MongoDB container."""
-    container = MongoDBContainer()
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture(scope="module")
-def kafka_container():
-    """Start Kafka container."""
-    container = KafkaContainer()
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture(scope="module")
-def minio_container():
-    """Start MinIO container."""
-    container = MinIOContainer()
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture
-def mongo_client(mongodb_container):
-    """Get MongoDB client."""
-    client = MongoClient(mongodb_container.get_connection_string())
-    yield client
-    client.close()
-
-
-@pytest.fixture
-def test_db(mongo_client):
-    """Get test database."""
-    db = mongo_client["testdb"]
-    yield db
-    mongo_client.drop_database("testdb")
+pytestmark = pytest.mark.cdc_slow
 
 
 def test_update_document_replicates_to_delta(
@@ -86,7 +40,13 @@ def test_update_document_replicates_to_delta(
     collection.insert_one(initial_document)
     print(f"Inserted document with _id: {initial_document['_id']}")
 
-    time.sleep(30)
+    storage_options = minio_container.get_storage_options()
+    table_uri = f"s3://lakehouse/tables/{test_db.name}_products"
+
+    id_filter = ds.field("_id") == "product_001"
+    columns = ["_id", "price", "stock", "_cdc_operation", "_cdc_timestamp"]
+
+    wait_for_delta_row(table_uri, storage_options, id_filter, columns=["_id"])
 
     collection.update_one(
         {"_id": "product_001"},
@@ -100,28 +60,20 @@ def test_update_document_replicates_to_delta(
     )
     print("Updated document price and stock")
 
-    time.sleep(60)
-
-    storage_options = minio_container.get_storage_options()
-    table_uri = "s3://lakehouse/tables/testdb_products"
-
     try:
-        delta_table = DeltaTable(table_uri, storage_options=storage_options)
-        df = delta_table.to_pyarrow_table()
-
-        print(f"Delta table records: {len(df)}")
-
-        id_filter = pc.equal(df["_id"], "product_001")
-        filtered_df = df.filter(id_filter)
+        # Insert + update
+        filtered_df = wait_for_delta_row(
+            table_uri, storage_options, id_filter, columns=columns, min_rows=2
+        )
 
         assert len(filtered_df) >= 1, f"Expected at least 1 record, found {len(filtered_df)}"
 
-        records = filtered_df.to_pylist()
+        update_count = pc.sum(pc.equal(filtered_df["_cdc_operation"], "update")).as_py()
+        assert update_count >= 1, "Expected at least one update record"
 
-        update_records = [r for r in records if r["_cdc_operation"] == "update"]
-        assert len(update_records) >= 1, "Expected at least one update record"
-
-        latest_record = sorted(records, key=lambda r: r["_cdc_timestamp"])[-1]
+        max_ts = pc.max(filtered_df["_cdc_timestamp"])
+        latest_tbl = filtered_df.filter(pc.equal(filtered_df["_cdc_timestamp"], max_ts))
+        latest_record = latest_tbl.slice(0, 1).to_pylist()[0]
         assert latest_record["price"] == 24.99
         assert latest_record["stock"] == 150
 
@@ -153,36 +105,36 @@ def test_multiple_updates_replicate(
         "version": 1
     })
 
-    time.sleep(30)
-
-    for i in range(2, 6):
-        collection.update_one(
-            {"_id": "item_001"},
-            {
-                "$set": {
-                    "quantity": 100 + i * 10,
-                    "version": i
-                }
-            }
-        )
-        time.sleep(5)
-
-    time.sleep(60)
-
     storage_options = minio_container.get_storage_options()
-    table_uri = "s3://lakehouse/tables/testdb_inventory"
+    table_uri = f"s3://lakehouse/tables/{test_db.name}_inventory"
+
+    id_filter = ds.field("_id") == "item_001"
+    columns = ["_id", "version", "_cdc_operation", "_cdc_timestamp"]
+
+    wait_for_delta_row(table_uri, storage_options, id_filter, columns=["_id"])
+
+    collection.bulk_write(
+        [
+            UpdateOne(
+                {"_id": "item_001"},
+                {"$set": {"quantity": 100 + i * 10, "version": i}}
+            )
+            for i in range(2, 6)
+        ],
+        ordered=True
+    )
 
     try:
-        delta_table = DeltaTable(table_uri, storage_options=storage_options)
-        df = delta_table.to_pyarrow_table()
-
-        id_filter = pc.equal(df["_id"], "item_001")
-        filtered_df = df.filter(id_filter)
+        # Insert + 4 updates, i.e. until version 5 has landed
+        filtered_df = wait_for_delta_row(
+            table_uri, storage_options, id_filter, columns=columns, min_rows=5
+        )
 
-        records = filtered_df.to_pylist()
-        update_records = [r for r in records if r["_cdc_operation"] == "update"]
+        update_count = pc.sum(pc.equal(filtered_df["_cdc_operation"], "update")).as_py()
+        assert update_count >= 4, f"Expected at least 4 updates, found {update_count}"
 
-        assert len(update_records) >= 4, f"Expected at least 4 updates, found {len(update_records)}"
+        versions = pc.unique(filtered_df["version"])
+        assert len(versions) >= 5, f"Expected versions 1-5, found {versions.to_pylist()}"
 
         print("Test passed: Multiple updates successfully replicated")
 
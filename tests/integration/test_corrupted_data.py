@@ -6,10 +6,104 @@ and routed to the Dead Letter Queue without crashing the pipeline.
 """
 
 import pytest
+import base64
 import json
 from datetime import datetime
+from itertools import islice
+from typing import Any
 from unittest.mock import Mock, AsyncMock
 
+from bson import ObjectId
+
+# Decode events with orjson when available, as on the hot consumer path;
+# fall back to the stdlib so the tests still run without it.
+try:
+    import orjson as _json
+
+    _JSON_ERR = _json.JSONDecodeError
+except ImportError:
+    _json = json
+    _JSON_ERR = json.JSONDecodeError
+
+
+def _try_parse(event_bytes: bytes):
+    """Decode one event, returning ``(event, None)`` or ``(None, raw_bytes)``."""
+    try:
+        return _json.loads(event_bytes), None
+    except _JSON_ERR:
+        return None, event_bytes
+
+
+def partition_events(events):
+    """Split raw events into decoded events and corrupted ones for the DLQ."""
+    pairs = [_try_parse(event_bytes) for event_bytes in events]
+    processed = [event for event, _ in pairs if event is not None]
+    dlq_events = [raw for _, raw in pairs if raw is not None]
+    return processed, dlq_events
+
+
+_REQUIRED_FIELDS = frozenset(("_id",))
+
+
+def validate_event(evt: dict[str, Any]) -> bool:
+    """Check that a change event's ``after`` image has all required fields."""
+    payload = evt.get("payload")
+    if not payload:
+        return False
+    after = payload.get("after")
+    return after is not None and _REQUIRED_FIELDS.issubset(after)
+
+
+def validate_debezium_structure(evt: dict[str, Any]) -> bool:
+    """Check that an event has a Debezium envelope with an operation."""
+    payload = evt.get("payload")
+    return payload is not None and "op" in payload
+
+
+# MongoDB's maximum BSON document size
+MAX_DOCUMENT_BYTES = 16 * 1024 * 1024
+
+
+def is_oversized(event_bytes: bytes, limit: int = MAX_DOCUMENT_BYTES) -> bool:
+    """Check whether a raw change event is larger than the document size limit."""
+    return len(event_bytes) > limit
+
+
+def iter_batches(events, batch_size: int):
+    """Yield lists of up to ``batch_size`` events, like successive consumer polls."""
+    it = iter(events)
+    while batch := list(islice(it, batch_size)):
+        yield batch
+
+
+@pytest.fixture(params=[1, 100, 1000])
+def batch_size(request):
+    """Records per poll: single-event polls up to production-sized batches."""
+    return request.param
+
+
+# Corruption rates are tracked in integer basis points (1 bp = 0.01%), so
+# rate arithmetic and alert thresholds are exact and need no float ops.
+CORRUPTION_ALERT_THRESHOLD_BP = 100  # 1%
+CORRUPTION_SPIKE_FACTOR = 10  # 10x the historical average
+
+
+def corruption_rate_bp(corrupted: int, total: int) -> int:
+    """Return the share of corrupted events in basis points."""
+    return 0 if total == 0 else (corrupted * 10000) // total
+
+
+# Constant defaults; the timestamp default is only computed when missing.
+_RECORD_DEFAULTS = {"version": 1}
+
+
+def apply_record_defaults(after: dict) -> dict:
+    """Fill missing fields of a change event's ``after`` image with defaults."""
+    record = _RECORD_DEFAULTS | after
+    if "timestamp" not in record:
+        record["timestamp"] = datetime.utcnow().isoformat()
+    return record
+
 
 class TestCorruptedEventDetection:
     """Test detection of various corrupted event types"""
@@ -18,8 +112,8 @@ class TestCorruptedEventDetection:
         """Test detecting invalid JSON in Kafka message"""
         corrupted_message = b"{ invalid json structure"
 
-        with pytest.raises(json.JSONDecodeError):
-            json.loads(corrupted_message)
+        with pytest.raises(_JSON_ERR):
+            _json.loads(corrupted_message)
 
     def test_detect_missing_required_fields(self):
         """Test detecting events with missing required fields"""
@@ -30,12 +124,6 @@ class TestCorruptedEventDetection:
             }
         }
 
-        required_fields = ["_id"]
-
-        def validate_event(evt):
-            payload = evt.get("payload", {}).get("after", {})
-            return all(field in payload for field in required_fields)
-
         assert validate_event(event) is False
 
     def test_detect_invalid_bson_types(self):
@@ -49,29 +137,28 @@ class TestCorruptedEventDetection:
             }
         }
 
-        def is_valid_objectid(oid_str):
-            return len(oid_str) == 24 and all(c in "0123456789abcdef" for c in oid_str.lower())
-
         oid = event["payload"]["after"]["_id"].get("$oid", "")
-        assert is_valid_objectid(oid) is False
+        assert ObjectId.is_valid(oid) is False
 
-    def test_detect_oversized_document(self):
+    @pytest.mark.parametrize("over_by, expected", [(-1, False), (0, False), (1, True)])
+    def test_detect_oversized_document(self, over_by, expected):
         """Test detecting documents exceeding size limit"""
-        # 20MB document (exceeds typical 16MB MongoDB limit)
-        large_data = "x" * (20 * 1024 * 1024)
         event = {
             "payload": {
                 "after": {
                     "_id": "abc123",
-                    "large_field": large_data
+                    "large_field": "x" * 1024
                 }
             }
         }
+        event_bytes = json.dumps(event).encode('utf-8')
 
-        max_size_bytes = 16 * 1024 * 1024  # 16MB
-        event_size = len(json.dumps(event).encode('utf-8'))
+        # A limit just around the event's size stands in for MongoDB's 16MB,
+        # so the boundary is checked without building a 20MB document
+        limit = len(event_bytes) - over_by
 
-        assert event_size > max_size_bytes
+        assert is_oversized(event_bytes, limit) is expected
+        assert is_oversized(event_bytes) is False
 
     def test_detect_malformed_debezium_envelope(self):
         """Test detecting malformed Debezium event envelope"""
@@ -81,9 +168,6 @@ class TestCorruptedEventDetection:
             "timestamp": 1638360000000
         }
 
-        def validate_debezium_structure(evt):
-            return "payload" in evt and "op" in evt.get("payload", {})
-
         assert validate_debezium_structure(malformed_event) is False
 
 
@@ -97,41 +181,41 @@ class TestCorruptedEventHandling:
         corrupted_event = b"{ invalid"
 
         try:
-            json.loads(corrupted_event)
-        except json.JSONDecodeError as e:
-            await mock_dlq.send(
-                topic="cdc.dead_letter_queue",
-                value=json.dumps({
-                    "original_event": corrupted_event.decode('utf-8', errors='replace'),
-                    "reason": "invalid_json",
-                    "error_message": str(e),
-                    "timestamp": datetime.utcnow().isoformat()
-                }).encode('utf-8')
-            )
-
-        mock_dlq.send.assert_called_once()
+            _json.loads(corrupted_event)
+        except _JSON_ERR as e:
+            # Undecodable bytes go out as base64 rather than being scanned
+            # and replaced as UTF-8; the producer serializes the dict.
+            await mock_dlq.send_dict("cdc.dead_letter_queue", {
+                "original_event_b64": base64.b64encode(corrupted_event).decode("ascii"),
+                "reason": "invalid_json",
+                "error_message": str(e),
+                "timestamp": datetime.utcnow().isoformat()
+            })
+
+        mock_dlq.send_dict.assert_awaited_once()
+        topic, payload = mock_dlq.send_dict.await_args.args
+        assert topic == "cdc.dead_letter_queue"
+        assert base64.b64decode(payload["original_event_b64"]) == corrupted_event
 
     @pytest.mark.asyncio
-    async def test_continue_processing_after_corruption(self):
+    async def test_continue_processing_after_corruption(self, batch_size):
         """Test that pipeline continues after encountering corrupted event"""
         events = [
-            b'{"payload": {"after": {"_id": "1", "data": "valid"}}}',
-            b'{ corrupted event',
-            b'{"payload": {"after": {"_id": "2", "data": "valid"}}}',
+            b'{ corrupted event' if i % 10 == 5
+            else b'{"payload": {"after": {"_id": "%d", "data": "valid"}}}' % i
+            for i in range(2500)
         ]
 
         processed = []
         dlq_events = []
+        for batch in iter_batches(events, batch_size):
+            batch_processed, batch_dlq = partition_events(batch)
+            processed.extend(batch_processed)
+            dlq_events.extend(batch_dlq)
 
-        for event_bytes in events:
-            try:
-                event = json.loads(event_bytes)
-                processed.append(event)
-            except json.JSONDecodeError:
-                dlq_events.append(event_bytes)
-
-        assert len(processed) == 2
-        assert len(dlq_events) == 1
+        assert len(processed) == 2250
+        assert len(dlq_events) == 250
+        assert processed[0]["payload"]["after"]["_id"] == "0"
 
     @pytest.mark.asyncio
     async def test_log_corrupted_event_details(self, caplog):
@@ -143,8 +227,8 @@ class TestCorruptedEventHandling:
         corrupted_event = b'{"partial": "data"'
 
         try:
-            json.loads(corrupted_event)
-        except json.JSONDecodeError as e:
+            _json.loads(corrupted_event)
+        except _JSON_ERR as e:
             logger.error(
                 "Corrupted event detected",
                 extra={
@@ -167,9 +251,10 @@ class TestCorruptionMetrics:
             "corrupted_events": 5
         }
 
-        corruption_rate = metrics["corrupted_events"] / metrics["total_events"]
+        rate_bp = corruption_rate_bp(metrics["corrupted_events"], metrics["total_events"])
 
-        assert corruption_rate == 0.005  # 0.5%
+        assert rate_bp == 50  # 0.5%
+        assert corruption_rate_bp(0, 0) == 0
 
     def test_track_corruption_by_type(self):
         """Test tracking corruption types"""
@@ -221,13 +306,7 @@ class TestPartialDataRecovery:
             }
         }
 
-        defaults = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "version": 1
-        }
-
-        # Merge with defaults
-        complete_record = {**defaults, **event["payload"]["after"]}
+        complete_record = apply_record_defaults(event["payload"]["after"])
 
         assert "timestamp" in complete_record
         assert complete_record["_id"] == "abc123"
@@ -238,21 +317,19 @@ class TestAlertingOnCorruption:
 
     def test_alert_on_high_corruption_rate(self):
         """Test alerting when corruption rate exceeds threshold"""
-        corruption_rate = 0.05  # 5%
-        threshold = 0.01  # 1%
+        rate_bp = corruption_rate_bp(50, 1000)  # 5%
 
-        should_alert = corruption_rate > threshold
+        should_alert = rate_bp > CORRUPTION_ALERT_THRESHOLD_BP
 
         assert should_alert is True
 
     def test_alert_on_corruption_spike(self):
         """Test alerting on sudden spike in corruption"""
-        historical_rate = [0.001, 0.001, 0.002, 0.001]  # Normal: ~0.1%
-        current_rate = 0.05  # 5% - spike!
+        historical_bp = [10, 10, 20, 10]  # Normal: ~0.1%
+        current_bp = 500  # 5% - spike!
 
-        avg_historical = sum(historical_rate) / len(historical_rate)
-        spike_threshold = 10  # 10x normal
+        avg_bp = sum(historical_bp) // len(historical_bp)
 
-        is_spike = current_rate > (avg_historical * spike_threshold)
+        is_spike = current_bp > avg_bp * CORRUPTION_SPIKE_FACTOR
 
         assert is_spike is True
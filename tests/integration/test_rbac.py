@@ -12,18 +12,24 @@ Tests cover:
 These tests use testcontainers for PostgreSQL and FastAPI TestClient.
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+
 import pytest
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 from datetime import datetime, timedelta, timezone
-from fastapi import FastAPI, Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, status
+from fastapi.security import HTTPBearer
+from fastapi.security.utils import get_authorization_scheme_param
 from fastapi.testclient import TestClient
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from jose import jwt, JWTError
-from testcontainers.postgres import PostgresContainer
-import psycopg2
-from psycopg2.extras import RealDictCursor
 from enum import Enum
+from functools import lru_cache, reduce
+from operator import or_
 
 
 # ============================================================================
@@ -64,25 +70,38 @@ class Role(str, Enum):
 
 
 # Role permissions mapping
-ROLE_PERMISSIONS: Dict[Role, set] = {
-    Role.ANALYST: {
+ROLE_PERMISSIONS: Dict[Role, frozenset[Permission]] = {
+    Role.ANALYST: frozenset({
         Permission.READ_MAPPINGS,
         Permission.VIEW_METRICS,
-    },
-    Role.OPERATOR: {
+    }),
+    Role.OPERATOR: frozenset({
         Permission.READ_MAPPINGS,
         Permission.VIEW_METRICS,
         Permission.CREATE_MAPPINGS,
         Permission.UPDATE_MAPPINGS,
-    },
-    Role.ADMIN: {
+    }),
+    Role.ADMIN: frozenset({
         Permission.READ_MAPPINGS,
         Permission.VIEW_METRICS,
         Permission.CREATE_MAPPINGS,
         Permission.UPDATE_MAPPINGS,
         Permission.DELETE_MAPPINGS,
         Permission.MANAGE_USERS,
-    },
+    }),
+}
+
+# Permission checks as bit tests: one bit per permission, one mask per role name
+PERM_BITS: Dict[Permission, int] = {p: 1 << i for i, p in enumerate(Permission)}
+ROLE_BITS: Dict[str, int] = {
+    role.value: reduce(or_, (PERM_BITS[p] for p in perms), 0)
+    for role, perms in ROLE_PERMISSIONS.items()
+}
+
+# Names of the roles that grant each permission
+PERMISSION_ROLES: Dict[Permission, frozenset[str]] = {
+    p: frozenset(role.value for role, perms in ROLE_PERMISSIONS.items() if p in perms)
+    for p in Permission
 }
 
 
@@ -91,7 +110,8 @@ class TokenData(BaseModel):
 
     user_id: str
     username: str
-    roles: list[str]
+    roles: frozenset[str]
+    permissions: frozenset[Permission] = frozenset()
 
 
 class MappingCreate(BaseModel):
@@ -127,16 +147,17 @@ class UserResponse(BaseModel):
 # ============================================================================
 
 
+_TOKEN_TTL = timedelta(minutes=AuthConfig.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+
 def create_access_token(data: Dict[str, Any]) -> str:
     """Create JWT access token."""
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(
-        minutes=AuthConfig.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
+    now = datetime.now(timezone.utc)
 
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + _TOKEN_TTL,
+        "iat": now,
     })
 
     return jwt.encode(
@@ -146,26 +167,65 @@ def create_access_token(data: Dict[str, Any]) -> str:
     )
 
 
-def decode_token(token: str) -> Dict[str, Any]:
-    """Decode JWT token."""
-    return jwt.decode(
+# Verified token payloads keyed by a digest of the raw token, least recently
+# used first. Only tokens that passed signature verification are stored; a
+# hit just re-checks expiry.
+TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: "OrderedDict[bytes, Mapping[str, Any]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def decode_token(token: str) -> Mapping[str, Any]:
+    """Decode JWT token, reusing the verified payload of a token seen before.
+
+    The payload is read-only: a cached payload is shared by every request
+    that presents the same token.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+        if payload is not None:
+            _token_cache.move_to_end(key)
+
+    if payload is not None:
+        if payload["exp"] < time.time():
+            with _token_cache_lock:
+                _token_cache.pop(key, None)
+            raise JWTError("Signature has expired.")
+        return payload
+
+    payload = MappingProxyType(jwt.decode(
         token,
         AuthConfig.JWT_SECRET_KEY,
         algorithms=[AuthConfig.JWT_ALGORITHM],
-    )
+    ))
+
+    if "exp" in payload:
+        with _token_cache_lock:
+            _token_cache[key] = payload
+            if len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+                _token_cache.popitem(last=False)
+
+    return payload
 
 
 def has_permission(user_roles: list[str], required_permission: Permission) -> bool:
     """Check if user has required permission."""
-    for role_name in user_roles:
-        try:
-            role = Role(role_name)
-            if required_permission in ROLE_PERMISSIONS.get(role, set()):
-                return True
-        except ValueError:
-            continue
+    return not PERMISSION_ROLES[required_permission].isdisjoint(user_roles)
+
+
+def has_any_permission(user_roles: list[str], required_permissions: list[Permission]) -> bool:
+    """Check if user has at least one of the required permissions."""
+    user_mask = reduce(or_, (ROLE_BITS.get(role_name, 0) for role_name in user_roles), 0)
+    required_mask = reduce(or_, (PERM_BITS[p] for p in required_permissions), 0)
+    return bool(user_mask & required_mask)
+
 
-    return False
+def role_permissions(user_roles: list[str]) -> frozenset[Permission]:
+    """Get the combined permissions of the given roles, ignoring unknown roles."""
+    roles = (Role._value2member_map_.get(role_name) for role_name in user_roles)
+    return frozenset().union(*(ROLE_PERMISSIONS[role] for role in roles if role is not None))
 
 
 # ============================================================================
@@ -173,20 +233,41 @@ def has_permission(user_roles: list[str], required_permission: Permission) -> bo
 # ============================================================================
 
 
+class BearerToken(HTTPBearer):
+    """HTTPBearer that returns the raw token instead of a credentials model."""
+
+    async def __call__(self, request: Request) -> str:
+        scheme, token = get_authorization_scheme_param(request.headers.get("Authorization"))
+        if not token or scheme.lower() != "bearer":
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authenticated")
+        return token
+
+
 app = FastAPI()
-security = HTTPBearer()
+security = BearerToken()
 
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> TokenData:
+def get_current_user(token: str = Depends(security)) -> TokenData:
     """Extract and validate current user from JWT token."""
     try:
-        token = credentials.credentials
         payload = decode_token(token)
 
-        token_data = TokenData(
+        # A valid signature says who issued the token, not that its claims
+        # have the right shape; check that cheaply, then skip model validation
+        roles = payload.get("roles")
+        if not (
+            isinstance(payload.get("user_id"), str)
+            and isinstance(payload.get("username"), str)
+            and isinstance(roles, list)
+            and all(isinstance(role_name, str) for role_name in roles)
+        ):
+            raise JWTError("Malformed token claims.")
+
+        token_data = TokenData.model_construct(
             user_id=payload["user_id"],
             username=payload["username"],
-            roles=payload["roles"],
+            roles=frozenset(roles),
+            permissions=role_permissions(roles),
         )
 
         return token_data
@@ -199,29 +280,44 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
         )
 
 
+# The checkers below call get_current_user directly instead of depending on
+# it, so FastAPI resolves one dependency on top of HTTPBearer per endpoint.
+
+
+@lru_cache(maxsize=None)
 def require_permission(permission: Permission):
     """Dependency to require specific permission."""
-
-    def permission_checker(current_user: TokenData = Depends(get_current_user)) -> TokenData:
-        if not has_permission(current_user.roles, permission):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Permission denied: {permission.value} required",
-            )
+    detail = f"Permission denied: {permission.value} required"
+
+    # A permission every role grants only needs the user to hold some known
+    # role; users with no (or only unknown) roles have no permissions at all.
+    if all(permission in perms for perms in ROLE_PERMISSIONS.values()):
+        def any_role_checker(token: str = Depends(security)) -> TokenData:
+            current_user = get_current_user(token)
+            if not current_user.permissions:
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+            return current_user
+
+        return any_role_checker
+
+    def permission_checker(token: str = Depends(security)) -> TokenData:
+        current_user = get_current_user(token)
+        if permission not in current_user.permissions:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
         return current_user
 
     return permission_checker
 
 
+@lru_cache(maxsize=None)
 def require_role(role: Role):
     """Dependency to require specific role."""
+    detail = f"Role denied: {role.value} required"
 
-    def role_checker(current_user: TokenData = Depends(get_current_user)) -> TokenData:
+    def role_checker(token: str = Depends(security)) -> TokenData:
+        current_user = get_current_user(token)
         if role.value not in current_user.roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Role denied: {role.value} required",
-            )
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
         return current_user
 
     return role_checker
@@ -232,20 +328,40 @@ def require_role(role: Role):
 # ============================================================================
 
 
-@app.get("/api/v1/mappings")
+# Bodies of endpoints whose response never changes, serialized once at import.
+# The endpoints return them as a raw Response, which FastAPI passes through
+# without serializing; their decorators keep response_model for the schema.
+_MAPPINGS_BODY = TypeAdapter(list[MappingResponse]).dump_json([
+    MappingResponse(
+        id=1,
+        name="users_mapping",
+        source_collection="mongodb.db.users",
+        target_table="delta_users",
+        created_by="admin",
+    )
+])
+_METRICS_BODY = TypeAdapter(Dict[str, Any]).dump_json({
+    "mappings_count": 10,
+    "active_pipelines": 3,
+    "records_processed": 1000000,
+})
+_USERS_BODY = TypeAdapter(list[Dict[str, Any]]).dump_json([
+    {
+        "id": 1,
+        "username": "admin",
+        "email": "admin@example.com",
+        "roles": ["admin"],
+    }
+])
+_HEALTH_BODY = TypeAdapter(Dict[str, str]).dump_json({"status": "healthy"})
+
+
+@app.get("/api/v1/mappings", response_model=list[MappingResponse])
 async def list_mappings(
     current_user: TokenData = Depends(require_permission(Permission.READ_MAPPINGS))
-) -> list[MappingResponse]:
+) -> Response:
     """List all mappings (requires read permission)."""
-    return [
-        MappingResponse(
-            id=1,
-            name="users_mapping",
-            source_collection="mongodb.db.users",
-            target_table="delta_users",
-            created_by="admin",
-        )
-    ]
+    return Response(content=_MAPPINGS_BODY, media_type="application/json")
 
 
 @app.post("/api/v1/mappings", status_code=status.HTTP_201_CREATED)
@@ -288,31 +404,20 @@ async def delete_mapping(
     return None
 
 
-@app.get("/api/v1/metrics")
+@app.get("/api/v1/metrics", response_model=Dict[str, Any])
 async def get_metrics(
     current_user: TokenData = Depends(require_permission(Permission.VIEW_METRICS))
-) -> Dict[str, Any]:
+) -> Response:
     """Get metrics (requires view metrics permission)."""
-    return {
-        "mappings_count": 10,
-        "active_pipelines": 3,
-        "records_processed": 1000000,
-    }
+    return Response(content=_METRICS_BODY, media_type="application/json")
 
 
-@app.get("/api/v1/admin/users")
+@app.get("/api/v1/admin/users", response_model=list[Dict[str, Any]])
 async def list_users(
     current_user: TokenData = Depends(require_permission(Permission.MANAGE_USERS))
-) -> list[Dict[str, Any]]:
+) -> Response:
     """List users (admin only)."""
-    return [
-        {
-            "id": 1,
-            "username": "admin",
-            "email": "admin@example.com",
-            "roles": ["admin"],
-        }
-    ]
+    return Response(content=_USERS_BODY, media_type="application/json")
 
 
 @app.post("/api/v1/admin/users", status_code=status.HTTP_201_CREATED)
@@ -327,10 +432,10 @@ async def create_user(
     }
 
 
-@app.get("/api/v1/health")
-async def health_check() -> Dict[str, str]:
+@app.get("/api/v1/health", response_model=Dict[str, str])
+async def health_check() -> Response:
     """Public health check endpoint (no authentication required)."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # ============================================================================
@@ -341,6 +446,8 @@ async def health_check() -> Dict[str, str]:
 @pytest.fixture(scope="module")
 def postgres_container():
     """Create PostgreSQL testcontainer."""
+    from testcontainers.postgres import PostgresContainer
+
     with PostgresContainer("postgres:15-alpine") as postgres:
         yield postgres
 
@@ -348,6 +455,8 @@ def postgres_container():
 @pytest.fixture(scope="module")
 def db_connection(postgres_container):
     """Create database connection."""
+    import psycopg2
+
     connection = psycopg2.connect(
         host=postgres_container.get_container_host_ip(),
         port=postgres_container.get_exposed_port(5432),
@@ -360,50 +469,57 @@ def db_connection(postgres_container):
     connection.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create FastAPI test client."""
-    return TestClient(app)
+    """Create FastAPI test client shared by the module's tests."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
-@pytest.fixture
-def analyst_token():
-    """Create JWT token for analyst user."""
-    return create_access_token({
-        "user_id": "1",
-        "username": "analyst_user",
-        "roles": ["analyst"],
-    })
+# Claims for the fixed test users, one per role combination
+TEST_USER_CLAIMS: Dict[str, Dict[str, Any]] = {
+    "analyst": {"user_id": "1", "username": "analyst_user", "roles": ["analyst"]},
+    "operator": {"user_id": "2", "username": "operator_user", "roles": ["operator"]},
+    "admin": {"user_id": "3", "username": "admin_user", "roles": ["admin"]},
+    "multi_role": {
+        "user_id": "4",
+        "username": "multi_role_user",
+        "roles": ["analyst", "operator"],
+    },
+}
 
 
-@pytest.fixture
-def operator_token():
-    """Create JWT token for operator user."""
-    return create_access_token({
-        "user_id": "2",
-        "username": "operator_user",
-        "roles": ["operator"],
-    })
+@pytest.fixture(scope="session")
+def jwt_tokens() -> Dict[str, str]:
+    """Sign one JWT token per test user for the whole session."""
+    return {
+        name: create_access_token(claims)
+        for name, claims in TEST_USER_CLAIMS.items()
+    }
 
 
-@pytest.fixture
-def admin_token():
-    """Create JWT token for admin user."""
-    return create_access_token({
-        "user_id": "3",
-        "username": "admin_user",
-        "roles": ["admin"],
-    })
+@pytest.fixture(scope="session")
+def analyst_token(jwt_tokens):
+    """JWT token for analyst user."""
+    return jwt_tokens["analyst"]
 
 
-@pytest.fixture
-def multi_role_token():
-    """Create JWT token for user with multiple roles."""
-    return create_access_token({
-        "user_id": "4",
-        "username": "multi_role_user",
-        "roles": ["analyst", "operator"],
-    })
+@pytest.fixture(scope="session")
+def operator_token(jwt_tokens):
+    """JWT token for operator user."""
+    return jwt_tokens["operator"]
+
+
+@pytest.fixture(scope="session")
+def admin_token(jwt_tokens):
+    """JWT token for admin user."""
+    return jwt_tokens["admin"]
+
+
+@pytest.fixture(scope="session")
+def multi_role_token(jwt_tokens):
+    """JWT token for user with multiple roles."""
+    return jwt_tokens["multi_role"]
 
 
 # ============================================================================
@@ -890,5 +1006,132 @@ class TestEdgeCases:
         assert response.status_code == 401
 
 
+    @pytest.mark.parametrize(
+        "claims",
+        [
+            {"user_id": "1", "username": "test", "roles": "admin"},
+            {"user_id": "1", "username": "test", "roles": [["admin"]]},
+            {"user_id": "1", "roles": ["admin"]},
+            {"username": "test", "roles": ["admin"]},
+        ],
+        ids=["roles_string", "roles_nested", "missing_username", "missing_user_id"],
+    )
+    def test_token_with_malformed_claims(self, client, claims):
+        """Test signed tokens whose claims have the wrong shape are rejected."""
+        token = create_access_token(claims)
+
+        response = client.get(
+            "/api/v1/mappings",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 401
+
+
+class TestStaticResponses:
+    """Tests for endpoints that return prebuilt JSON bodies."""
+
+    @pytest.mark.parametrize(
+        "path,schema_type",
+        [
+            ("/api/v1/mappings", "array"),
+            ("/api/v1/metrics", "object"),
+            ("/api/v1/admin/users", "array"),
+            ("/api/v1/health", "object"),
+        ],
+    )
+    def test_openapi_schema_keeps_response_model(self, path, schema_type):
+        """Test prebuilt-body endpoints still document their response model."""
+        responses = app.openapi()["paths"][path]["get"]["responses"]
+        schema = responses["200"]["content"]["application/json"]["schema"]
+
+        assert schema["type"] == schema_type
+        if path == "/api/v1/mappings":
+            assert schema["items"] == {"$ref": "#/components/schemas/MappingResponse"}
+
+    def test_mappings_body_matches_response_model(self, client, analyst_token):
+        """Test the prebuilt mappings body validates against MappingResponse."""
+        response = client.get(
+            "/api/v1/mappings",
+            headers={"Authorization": f"Bearer {analyst_token}"},
+        )
+
+        mappings = TypeAdapter(list[MappingResponse]).validate_json(response.content)
+        assert [m.name for m in mappings] == ["users_mapping"]
+
+
+class TestTokenCache:
+    """Tests for reuse of verified token payloads."""
+
+    def test_repeated_token_reuses_verified_payload(self, admin_token):
+        """Test a token seen before is not verified again."""
+        first = decode_token(admin_token)
+
+        assert decode_token(admin_token) is first
+
+    def test_cached_token_rejected_after_expiry(self, admin_token, monkeypatch):
+        """Test a cached token is still rejected once it expires."""
+        payload = decode_token(admin_token)
+
+        monkeypatch.setattr(time, "time", lambda: payload["exp"] + 1)
+
+        with pytest.raises(JWTError):
+            decode_token(admin_token)
+
+    def test_cached_payload_is_read_only(self, admin_token):
+        """Test callers cannot alter the payload shared through the cache."""
+        payload = decode_token(admin_token)
+
+        with pytest.raises(TypeError):
+            payload["roles"] = ["admin", "superuser"]
+
+        assert decode_token(admin_token)["roles"] == ["admin"]
+
+    def test_least_recently_used_token_is_evicted(self, monkeypatch):
+        """Test a full cache evicts the token that was used longest ago."""
+        monkeypatch.setattr(f"{__name__}._token_cache", OrderedDict())
+        monkeypatch.setattr(f"{__name__}.TOKEN_CACHE_MAXSIZE", 2)
+        first, second, third = (
+            create_access_token({"user_id": str(i), "username": f"user{i}", "roles": ["analyst"]})
+            for i in range(3)
+        )
+
+        first_payload = decode_token(first)
+        second_payload = decode_token(second)
+        decode_token(first)
+        decode_token(third)
+
+        assert decode_token(first) is first_payload
+        assert decode_token(second) is not second_payload
+
+
+class TestPermissionHelpers:
+    """Tests for role/permission lookup helpers."""
+
+    @pytest.mark.parametrize("role", list(Role))
+    @pytest.mark.parametrize("permission", list(Permission))
+    def test_has_permission_matches_role_permissions(self, role, permission):
+        """Test the per-permission role table agrees with ROLE_PERMISSIONS."""
+        expected = permission in ROLE_PERMISSIONS[role]
+
+        assert has_permission([role.value], permission) is expected
+        assert has_permission(["superuser", role.value], permission) is expected
+
+    @pytest.mark.parametrize(
+        "roles,required,expected",
+        [
+            (["analyst"], [Permission.DELETE_MAPPINGS, Permission.VIEW_METRICS], True),
+            (["analyst"], [Permission.DELETE_MAPPINGS, Permission.MANAGE_USERS], False),
+            (["analyst", "admin"], [Permission.MANAGE_USERS], True),
+            (["superuser"], [Permission.READ_MAPPINGS], False),
+            ([], [Permission.READ_MAPPINGS], False),
+            (["admin"], [], False),
+        ],
+    )
+    def test_has_any_permission(self, roles, required, expected):
+        """Test any-of permission check across the user's roles."""
+        assert has_any_permission(roles, required) is expected
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
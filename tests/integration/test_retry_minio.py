@@ -7,9 +7,19 @@ on transient failures and recovers when MinIO becomes available again.
 
 import pytest
 import asyncio
-from datetime import datetime
+import logging
+from dataclasses import dataclass
+from enum import IntEnum
 from unittest.mock import AsyncMock, Mock, patch
 import aiohttp
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+    wait_fixed,
+)
 
 
 # Will be implemented in T077-T080
@@ -17,12 +27,121 @@ import aiohttp
 # from delta_writer.utils.error_handler import retry_with_backoff
 # from delta_writer.writer.delta_writer import DeltaLakeWriter
 
+# Share one event loop across the module instead of one per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+_LOGGER = logging.getLogger("minio_retry")
+
+# Errors treated as transient MinIO failures
+TRANSIENT_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError, ConnectionError)
+
+# Response statuses treated as transient MinIO failures
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class HTTPError(Exception):
+    """MinIO request rejected with an HTTP error status."""
+
+    def __init__(self, status: int, reason: str):
+        super().__init__(f"HTTP {status}: {reason}")
+        self.status = status
+
+
+class ServiceUnavailable(HTTPError):
+    """MinIO responded 503 Service Unavailable."""
+
+    def __init__(self):
+        super().__init__(503, "Service Unavailable")
+
+
+class CircuitBreakerOpen(Exception):
+    """Call rejected because the MinIO circuit breaker is open."""
+
+
+class BreakerState(IntEnum):
+    """Circuit breaker states."""
+
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
+@dataclass(slots=True)
+class Breaker:
+    """Minimal circuit breaker state for simulated MinIO calls."""
+
+    state: BreakerState = BreakerState.CLOSED
+    failures: int = 0
+    threshold: int = 5
+
+
+def _is_transient_status(exc: BaseException) -> bool:
+    return isinstance(exc, HTTPError) and exc.status in TRANSIENT_STATUS_CODES
+
+
+def should_retry(exc: BaseException) -> bool:
+    """Check whether a failed MinIO call is worth retrying."""
+    return isinstance(exc, TRANSIENT_ERRORS) or _is_transient_status(exc)
+
+
+_RETRY_TRANSIENT = retry_if_exception_type(TRANSIENT_ERRORS)
+_RETRY_ANY_TRANSIENT = retry_if_exception(should_retry)
+_BACKOFF = wait_exponential(multiplier=0.1, max=1.0)
+
+# Exponential backoff schedule starting at 100ms: 0.1, 0.2, 0.4, ...
+BACKOFF_100MS = tuple(0.1 * (1 << i) for i in range(8))
+
+
+_real_sleep = asyncio.sleep
+
+
+class VirtualClock:
+    """Fake monotonic clock advanced by ``asyncio.sleep`` instead of waiting."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    async def sleep(self, delay, result=None):
+        self.now += max(delay, 0)
+        # Still yield to the event loop so concurrent tasks interleave
+        await _real_sleep(0)
+        return result
+
+
+@pytest.fixture(autouse=True)
+def virtual_clock(monkeypatch):
+    """Make every ``asyncio.sleep`` in these tests return immediately."""
+    clock = VirtualClock()
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+    return clock
+
+
+async def _sleep(seconds: float) -> None:
+    # Looked up per call so tenacity's backoff goes through the virtual clock
+    await asyncio.sleep(seconds)
+
+
+def retrying(max_attempts: int = 3, wait=_BACKOFF, retry=_RETRY_TRANSIENT) -> AsyncRetrying:
+    """Build a retry controller for transient MinIO failures.
+
+    The policies are shared, but each retry loop gets its own controller:
+    AsyncRetrying keeps per-loop attempt state, which concurrent uploads
+    must not share.
+    """
+    return AsyncRetrying(
+        stop=stop_after_attempt(max_attempts),
+        wait=wait,
+        retry=retry,
+        reraise=True,
+        sleep=_sleep,
+    )
+
 
 class TestMinIOTransientFailures:
     """Test retry behavior for transient MinIO failures"""
 
     @pytest.fixture
-    async def minio_config(self):
+    def minio_config(self):
         """MinIO configuration for tests"""
         return {
             "endpoint": "localhost:9000",
@@ -33,86 +152,40 @@ class TestMinIOTransientFailures:
             "secure": False
         }
 
-    @pytest.mark.asyncio
-    async def test_retry_on_connection_error(self, minio_config):
-        """Test retry on MinIO connection error"""
+    @pytest.mark.parametrize(
+        "make_error,failures",
+        [
+            pytest.param(
+                lambda: aiohttp.ClientConnectionError("Connection to MinIO failed"),
+                2,
+                id="connection_error",
+            ),
+            pytest.param(
+                lambda: asyncio.TimeoutError("MinIO operation timed out"),
+                1,
+                id="timeout_error",
+            ),
+            pytest.param(ServiceUnavailable, 2, id="503_service_unavailable"),
+        ],
+    )
+    async def test_retry_on_transient_error(self, minio_config, make_error, failures):
+        """Test retry until a transiently failing MinIO upload succeeds"""
         call_count = 0
 
-        async def upload_with_connection_error():
+        async def flaky_upload():
             nonlocal call_count
             call_count += 1
-            if call_count < 3:
-                raise aiohttp.ClientConnectionError("Connection to MinIO failed")
+            if call_count <= failures:
+                raise make_error()
             return {"etag": "abc123", "version_id": "1"}
 
-        # Simulate retry
-        max_attempts = 3
-        for attempt in range(max_attempts):
-            try:
-                result = await upload_with_connection_error()
-                break
-            except aiohttp.ClientConnectionError:
-                if attempt == max_attempts - 1:
-                    raise
-                await asyncio.sleep(0.1 * (2 ** attempt))  # Exponential backoff
+        async for attempt in retrying(retry=_RETRY_ANY_TRANSIENT):
+            with attempt:
+                result = await flaky_upload()
 
         assert result["etag"] == "abc123"
-        assert call_count == 3
-
-    @pytest.mark.asyncio
-    async def test_retry_on_timeout_error(self, minio_config):
-        """Test retry on MinIO timeout error"""
-        call_count = 0
-
-        async def upload_with_timeout():
-            nonlocal call_count
-            call_count += 1
-            if call_count < 2:
-                raise asyncio.TimeoutError("MinIO operation timed out")
-            return {"etag": "def456"}
-
-        max_attempts = 3
-        for attempt in range(max_attempts):
-            try:
-                result = await upload_with_timeout()
-                break
-            except asyncio.TimeoutError:
-                if attempt == max_attempts - 1:
-                    raise
-                await asyncio.sleep(0.1)
-
-        assert result["etag"] == "def456"
-        assert call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_retry_on_503_service_unavailable(self, minio_config):
-        """Test retry on MinIO 503 Service Unavailable"""
-        call_count = 0
-
-        async def upload_with_503():
-            nonlocal call_count
-            call_count += 1
-            if call_count < 3:
-                raise Exception("HTTP 503: Service Unavailable")
-            return {"etag": "ghi789"}
+        assert call_count == failures + 1
 
-        max_attempts = 5
-        for attempt in range(max_attempts):
-            try:
-                result = await upload_with_503()
-                break
-            except Exception as e:
-                if "503" in str(e):
-                    if attempt == max_attempts - 1:
-                        raise
-                    await asyncio.sleep(0.2 * (2 ** attempt))
-                else:
-                    raise
-
-        assert result["etag"] == "ghi789"
-        assert call_count == 3
-
-    @pytest.mark.asyncio
     async def test_no_retry_on_non_retryable_error(self, minio_config):
         """Test that non-retryable errors don't trigger retry"""
         call_count = 0
@@ -120,15 +193,19 @@ class TestMinIOTransientFailures:
         async def upload_with_400_error():
             nonlocal call_count
             call_count += 1
-            raise Exception("HTTP 400: Bad Request")
+            raise HTTPError(400, "Bad Request")
 
         # Non-retryable errors should fail immediately
-        with pytest.raises(Exception, match="400"):
-            await upload_with_400_error()
+        with pytest.raises(HTTPError) as exc_info:
+            async for attempt in retrying(retry=_RETRY_ANY_TRANSIENT):
+                with attempt:
+                    await upload_with_400_error()
+
+        assert exc_info.value.status == 400
+        assert not should_retry(exc_info.value)
 
         assert call_count == 1
 
-    @pytest.mark.asyncio
     async def test_max_retries_exhausted(self, minio_config):
         """Test behavior when max retries are exhausted"""
         call_count = 0
@@ -138,15 +215,10 @@ class TestMinIOTransientFailures:
             call_count += 1
             raise aiohttp.ClientConnectionError("MinIO unreachable")
 
-        max_attempts = 3
         with pytest.raises(aiohttp.ClientConnectionError):
-            for attempt in range(max_attempts):
-                try:
+            async for attempt in retrying(wait=wait_fixed(0.1)):
+                with attempt:
                     await always_fails()
-                except aiohttp.ClientConnectionError:
-                    if attempt == max_attempts - 1:
-                        raise
-                    await asyncio.sleep(0.1)
 
         assert call_count == 3
 
@@ -154,7 +226,6 @@ class TestMinIOTransientFailures:
 class TestMinIORecoveryScenarios:
     """Test MinIO recovery scenarios"""
 
-    @pytest.mark.asyncio
     async def test_recovery_after_temporary_outage(self):
         """Test recovery after MinIO comes back online"""
         minio_available = False
@@ -172,21 +243,14 @@ class TestMinIORecoveryScenarios:
                 raise ConnectionError("MinIO down")
             return {"etag": "recovered"}
 
-        max_attempts = 5
-        for attempt in range(max_attempts):
-            try:
+        async for attempt in retrying(max_attempts=5, wait=wait_fixed(0.1)):
+            with attempt:
                 result = await upload_with_recovery()
-                break
-            except ConnectionError:
-                if attempt == max_attempts - 1:
-                    raise
-                await asyncio.sleep(0.1)
 
         assert result["etag"] == "recovered"
         assert minio_available is True
         assert call_count == 3
 
-    @pytest.mark.asyncio
     async def test_partial_upload_resume(self):
         """Test resuming partial upload after failure"""
         uploaded_parts = []
@@ -202,51 +266,44 @@ class TestMinIORecoveryScenarios:
 
         # Upload with retry
         for part_num in range(1, total_parts + 1):
-            max_attempts = 3
-            for attempt in range(max_attempts):
-                try:
+            async for attempt in retrying(wait=wait_fixed(0.1)):
+                with attempt:
                     await upload_part(part_num)
-                    break
-                except ConnectionError:
-                    if attempt == max_attempts - 1:
-                        raise
-                    await asyncio.sleep(0.1)
 
         assert len(uploaded_parts) == total_parts
 
-    @pytest.mark.asyncio
     async def test_circuit_breaker_prevents_overload(self):
         """Test circuit breaker prevents overwhelming failing MinIO"""
-        circuit_state = {"failures": 0, "state": "closed", "threshold": 5}
+        breaker = Breaker(threshold=5)
 
         async def upload_with_circuit_breaker():
-            if circuit_state["state"] == "open":
-                raise Exception("Circuit breaker is open")
+            if breaker.state is BreakerState.OPEN:
+                raise CircuitBreakerOpen("Circuit breaker is open")
 
             # Simulate failure
-            circuit_state["failures"] += 1
-            if circuit_state["failures"] >= circuit_state["threshold"]:
-                circuit_state["state"] = "open"
+            breaker.failures += 1
+            if breaker.failures >= breaker.threshold:
+                breaker.state = BreakerState.OPEN
 
             raise ConnectionError("MinIO error")
 
         # Try uploads until circuit opens
-        with pytest.raises(Exception, match="Circuit breaker"):
+        with pytest.raises(CircuitBreakerOpen):
             for i in range(10):
                 try:
                     await upload_with_circuit_breaker()
                 except ConnectionError:
-                    if circuit_state["state"] == "open":
-                        raise Exception("Circuit breaker is open")
+                    if breaker.state is BreakerState.OPEN:
+                        raise CircuitBreakerOpen("Circuit breaker is open")
                 await asyncio.sleep(0.01)
 
-        assert circuit_state["state"] == "open"
+        assert breaker.state is BreakerState.OPEN
+        assert breaker.failures == breaker.threshold
 
 
 class TestMinIORetryMetrics:
     """Test metrics collection for MinIO retries"""
 
-    @pytest.mark.asyncio
     async def test_track_retry_attempts(self):
         """Test tracking number of retry attempts"""
         metrics = {
@@ -279,15 +336,14 @@ class TestMinIORetryMetrics:
         assert metrics["successful_attempts"] == 1
         assert metrics["retry_count"] == 2
 
-    @pytest.mark.asyncio
-    async def test_track_retry_duration(self):
+    async def test_track_retry_duration(self, virtual_clock):
         """Test tracking total retry duration"""
-        start_time = datetime.utcnow()
+        start_time = virtual_clock.now
         delays = []
 
         async def upload_with_delays():
             if len(delays) < 2:
-                delay = 0.1 * (2 ** len(delays))
+                delay = BACKOFF_100MS[len(delays)]
                 delays.append(delay)
                 await asyncio.sleep(delay)
                 raise ConnectionError("Retry")
@@ -302,8 +358,7 @@ class TestMinIORetryMetrics:
                 if attempt == max_attempts - 1:
                     raise
 
-        end_time = datetime.utcnow()
-        total_duration = (end_time - start_time).total_seconds()
+        total_duration = virtual_clock.now - start_time
 
         # Should have delays of 0.1s + 0.2s = 0.3s minimum
         assert total_duration >= 0.3
@@ -312,61 +367,55 @@ class TestMinIORetryMetrics:
 class TestMinIOBatchOperations:
     """Test retry logic for batch MinIO operations"""
 
-    @pytest.mark.asyncio
     async def test_batch_upload_with_partial_failures(self):
         """Test batch upload where some files fail"""
         files = [f"file_{i}.parquet" for i in range(10)]
-        uploaded = []
-        failed = []
 
         async def upload_file(filename):
             # Simulate intermittent failures
             if "file_5" in filename or "file_7" in filename:
                 raise ConnectionError(f"Failed to upload {filename}")
-            uploaded.append(filename)
             return {"file": filename, "etag": f"etag_{filename}"}
 
-        # Upload with retry per file
-        for filename in files:
-            max_attempts = 3
-            success = False
-            for attempt in range(max_attempts):
-                try:
-                    await upload_file(filename)
-                    success = True
-                    break
-                except ConnectionError:
-                    if attempt == max_attempts - 1:
-                        failed.append(filename)
-                    await asyncio.sleep(0.01)
+        # Upload concurrently with retry per file, at most 4 in flight
+        semaphore = asyncio.Semaphore(4)
+
+        async def upload_with_retry(filename):
+            async with semaphore:
+                async for attempt in retrying(wait=wait_fixed(0.01)):
+                    with attempt:
+                        return await upload_file(filename)
+
+        results = await asyncio.gather(
+            *(upload_with_retry(f) for f in files), return_exceptions=True
+        )
 
+        # Split outcomes in one pass over the gathered results
+        uploaded = [r["file"] for r in results if not isinstance(r, BaseException)]
+        failed = [f for f, r in zip(files, results) if isinstance(r, ConnectionError)]
+
+        assert len(uploaded) == 8
         assert len(failed) == 2
         assert "file_5.parquet" in failed
 
-    @pytest.mark.asyncio
     async def test_concurrent_uploads_with_retry(self):
         """Test concurrent uploads with individual retry logic"""
         files = [f"file_{i}.parquet" for i in range(5)]
-        results = []
 
         async def upload_with_retry(filename):
             attempt_count = 0
-            max_attempts = 3
 
-            for attempt in range(max_attempts):
-                try:
+            async for attempt in retrying(wait=wait_fixed(0.1)):
+                with attempt:
                     attempt_count += 1
                     if attempt_count < 2:
                         raise ConnectionError("Transient error")
                     return {"file": filename, "etag": f"etag_{filename}"}
-                except ConnectionError:
-                    if attempt == max_attempts - 1:
-                        raise
-                    await asyncio.sleep(0.1)
 
-        # Upload concurrently
-        tasks = [upload_with_retry(f) for f in files]
-        results = await asyncio.gather(*tasks, return_exceptions=False)
+        # Upload concurrently; a failing upload cancels the rest
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(upload_with_retry(f)) for f in files]
+        results = [task.result() for task in tasks]
 
         assert len(results) == 5
         assert all("etag" in r for r in results)
@@ -375,7 +424,6 @@ class TestMinIOBatchOperations:
 class TestMinIOBackpressure:
     """Test backpressure handling when MinIO is slow"""
 
-    @pytest.mark.asyncio
     async def test_backpressure_on_slow_uploads(self):
         """Test applying backpressure when MinIO is slow"""
         upload_queue = asyncio.Queue(maxsize=10)
@@ -388,31 +436,25 @@ class TestMinIOBackpressure:
             slow_uploads += 1
             return {"etag": f"etag_{slow_uploads}"}
 
-        # Producer: add items to queue
+        # Producer: add items to queue, blocking while it is full
         async def producer():
             for i in range(20):
                 await upload_queue.put({"data": f"data_{i}"})
+            await upload_queue.put(None)
 
-        # Consumer: process with backpressure
+        # Consumer: drain the queue until the producer is done
         async def consumer():
             processed = []
-            while not upload_queue.empty() or processed == []:
-                try:
-                    item = await asyncio.wait_for(upload_queue.get(), timeout=0.1)
-                    result = await upload_with_backpressure(item)
-                    processed.append(result)
-                except asyncio.TimeoutError:
-                    break
+            while (item := await upload_queue.get()) is not None:
+                processed.append(await upload_with_backpressure(item))
             return processed
 
-        # Run producer and consumer
-        await producer()
-        results = await consumer()
+        # Run producer and consumer together so the bounded queue throttles the producer
+        _, results = await asyncio.gather(producer(), consumer())
 
-        # Should process some items (queue size limits backpressure)
-        assert len(results) > 0
+        # Every item gets through; the queue only limits how many wait at once
+        assert len(results) == 20
 
-    @pytest.mark.asyncio
     async def test_rate_limiting_on_errors(self):
         """Test rate limiting when encountering many errors"""
         error_count = 0
@@ -448,7 +490,6 @@ class TestMinIOBackpressure:
 class TestMinIOHealthChecks:
     """Test MinIO health checks during retry"""
 
-    @pytest.mark.asyncio
     async def test_health_check_before_retry(self):
         """Test checking MinIO health before retrying"""
         minio_healthy = False
@@ -472,20 +513,23 @@ class TestMinIOHealthChecks:
         result = await upload_with_health_check()
         assert result["etag"] == "success"
 
-    @pytest.mark.asyncio
-    async def test_exponential_backoff_with_jitter(self):
-        """Test exponential backoff with jitter"""
+    async def test_exponential_backoff_with_jitter(self, virtual_clock):
+        """Test exponential backoff with equal jitter"""
         import random
 
+        # Dedicated generator, so the test neither reads nor reseeds the
+        # process-wide one other tests share
+        rng = random.Random(1234)
+        jitter = 1.0  # jitter adds up to 100% of the attempt's base wait
+        bases = [cap / 2 for cap in BACKOFF_100MS]
+
+        calls = 0
         delays = []
 
         async def upload_with_backoff():
-            if len(delays) < 3:
-                base_delay = 0.1 * (2 ** len(delays))
-                jitter = random.uniform(-0.1, 0.1) * base_delay
-                delay = base_delay + jitter
-                delays.append(delay)
-                await asyncio.sleep(delay)
+            nonlocal calls
+            calls += 1
+            if calls <= 3:
                 raise ConnectionError("Retry")
             return {"etag": "success"}
 
@@ -497,28 +541,34 @@ class TestMinIOHealthChecks:
             except ConnectionError:
                 if attempt == max_attempts - 1:
                     raise
+                # Equal jitter: half the backoff, plus a random share of the other half
+                base = bases[attempt]
+                delay = base + rng.random() * base * jitter
+                delays.append(delay)
+                await asyncio.sleep(delay)
 
-        # Verify exponential growth pattern (with jitter tolerance)
+        assert result == {"etag": "success"}
         assert len(delays) == 3
-        assert delays[1] > delays[0] * 1.5  # Roughly 2x with jitter
-        assert delays[2] > delays[1] * 1.5
+        assert virtual_clock.now == pytest.approx(sum(delays))
+
+        # Each delay stays within its attempt's jitter window
+        assert all(
+            base <= delay <= base * (1 + jitter) for delay, base in zip(delays, bases)
+        )
 
 
 class TestMinIORetryLogging:
     """Test logging during MinIO retry operations"""
 
-    @pytest.mark.asyncio
     async def test_log_retry_attempts(self, caplog):
         """Test that retry attempts are logged"""
-        import logging
-
-        logger = logging.getLogger("minio_retry")
+        caplog.set_level(logging.WARNING, logger=_LOGGER.name)
 
         async def upload_with_logging():
             for attempt in range(3):
                 try:
                     if attempt < 2:
-                        logger.warning(f"MinIO upload attempt {attempt + 1} failed, retrying...")
+                        _LOGGER.warning("MinIO upload attempt %d failed, retrying...", attempt + 1)
                         raise ConnectionError("Upload failed")
                     return {"etag": "success"}
                 except ConnectionError:
@@ -528,13 +578,14 @@ class TestMinIORetryLogging:
 
         result = await upload_with_logging()
         assert result["etag"] == "success"
+        assert [r.getMessage() for r in caplog.records] == [
+            "MinIO upload attempt 1 failed, retrying...",
+            "MinIO upload attempt 2 failed, retrying...",
+        ]
 
-    @pytest.mark.asyncio
     async def test_log_retry_exhausted(self, caplog):
         """Test logging when retries are exhausted"""
-        import logging
-
-        logger = logging.getLogger("minio_retry")
+        caplog.set_level(logging.ERROR, logger=_LOGGER.name)
 
         async def upload_fails_all_retries():
             max_attempts = 3
@@ -543,9 +594,11 @@ class TestMinIORetryLogging:
                     raise ConnectionError("MinIO down")
                 except ConnectionError:
                     if attempt == max_attempts - 1:
-                        logger.error("Max retries exhausted for MinIO upload")
+                        _LOGGER.error("Max retries exhausted for MinIO upload")
                         raise
                     await asyncio.sleep(0.01)
 
         with pytest.raises(ConnectionError):
             await upload_fails_all_retries()
+
+        assert [r.getMessage() for r in caplog.records] == ["Max retries exhausted for MinIO upload"]
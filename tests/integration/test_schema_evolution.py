@@ -3,11 +3,6 @@
 import pytest
 import time
 from datetime import datetime
-from typing import Generator
-from testcontainers.mongodb import MongoDbContainer
-from testcontainers.kafka import KafkaContainer
-from testcontainers.minio import MinioContainer
-import pymongo
 import pyarrow as pa
 from deltalake import DeltaTable
 
@@ -17,43 +12,9 @@ from delta_writer.src.transformers.schema_inferrer import SchemaInferrer
 
 
 @pytest.fixture(scope="module")
-def mongodb_container() -> Generator[MongoDbContainer, None, None]:
-    """Start MongoDB container for integration tests."""
-    container = MongoDbContainer("mongo:7.0")
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture(scope="module")
-def minio_container() -> Generator[MinioContainer, None, None]:
-    """Start MinIO container for integration tests."""
-    container = MinioContainer()
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture
-def mongodb_client(mongodb_container):
-    """Get MongoDB client."""
-    connection_url = mongodb_container.get_connection_url()
-    client = pymongo.MongoClient(connection_url)
-    yield client
-    client.close()
-
-
-@pytest.fixture
 def storage_options(minio_container):
     """Get MinIO storage options."""
-    return {
-        "AWS_ACCESS_KEY_ID": minio_container.access_key,
-        "AWS_SECRET_ACCESS_KEY": minio_container.secret_key,
-        "AWS_ENDPOINT_URL": minio_container.get_config()["endpoint"],
-        "AWS_ALLOW_HTTP": "true",
-        "AWS_REGION": "us-east-1",
-        "AWS_S3_ALLOW_UNSAFE_RENAME": "true"
-    }
+    return minio_container.get_storage_options()
 
 
 @pytest.fixture
@@ -65,10 +26,9 @@ def delta_writer(storage_options):
 class TestSchemaEvolutionNewFields:
     """Test schema evolution when new fields are added."""
 
-    def test_add_single_new_field(self, mongodb_client, delta_writer, storage_options):
+    def test_add_single_new_field(self, test_db, table_root, delta_writer, storage_options):
         """Test adding a single new field to documents."""
-        db = mongodb_client["test_db"]
-        collection = db["users"]
+        collection = test_db["users"]
 
         # Insert initial documents with basic schema
         initial_docs = [
@@ -88,7 +48,7 @@ class TestSchemaEvolutionNewFields:
             doc["_kafka_topic"] = "test.users"
             doc["_ingestion_date"] = datetime.now().date().isoformat()
 
-        table_uri = "s3://test-bucket/users_v1"
+        table_uri = f"{table_root}/users_v1"
         delta_writer.write_batch(table_uri, converted_docs)
 
         # Verify initial schema
@@ -141,10 +101,9 @@ class TestSchemaEvolutionNewFields:
         new_docs_df = df[df["_id"].isin([3, 4])]
         assert not new_docs_df["email"].isna().any()
 
-    def test_add_multiple_new_fields(self, mongodb_client, delta_writer, storage_options):
+    def test_add_multiple_new_fields(self, test_db, table_root, delta_writer, storage_options):
         """Test adding multiple new fields at once."""
-        db = mongodb_client["test_db"]
-        collection = db["products"]
+        collection = test_db["products"]
 
         # Initial documents
         initial_docs = [
@@ -163,7 +122,7 @@ class TestSchemaEvolutionNewFields:
             doc["_kafka_topic"] = "test.products"
             doc["_ingestion_date"] = datetime.now().date().isoformat()
 
-        table_uri = "s3://test-bucket/products_v1"
+        table_uri = f"{table_root}/products_v1"
         delta_writer.write_batch(table_uri, converted_docs)
 
         # Add documents with multiple new fields
@@ -206,10 +165,9 @@ class TestSchemaEvolutionNewFields:
         df = table.to_pandas()
         assert len(df) == 3
 
-    def test_add_nested_field(self, mongodb_client, delta_writer, storage_options):
+    def test_add_nested_field(self, test_db, table_root, delta_writer, storage_options):
         """Test adding nested fields to existing schema."""
-        db = mongodb_client["test_db"]
-        collection = db["orders"]
+        collection = test_db["orders"]
 
         # Initial documents with simple structure
         initial_docs = [
@@ -227,7 +185,7 @@ class TestSchemaEvolutionNewFields:
             doc["_kafka_topic"] = "test.orders"
             doc["_ingestion_date"] = datetime.now().date().isoformat()
 
-        table_uri = "s3://test-bucket/orders_v1"
+        table_uri = f"{table_root}/orders_v1"
         delta_writer.write_batch(table_uri, converted_docs)
 
         # Add document with nested field
@@ -268,10 +226,9 @@ class TestSchemaEvolutionNewFields:
         df = table.to_pandas()
         assert len(df) == 2
 
-    def test_schema_evolution_preserves_data_types(self, mongodb_client, delta_writer, storage_options):
+    def test_schema_evolution_preserves_data_types(self, test_db, table_root, delta_writer, storage_options):
         """Test that schema evolution preserves existing data types."""
-        db = mongodb_client["test_db"]
-        collection = db["metrics"]
+        collection = test_db["metrics"]
 
         # Initial documents
         initial_docs = [
@@ -289,7 +246,7 @@ class TestSchemaEvolutionNewFields:
             doc["_kafka_topic"] = "test.metrics"
             doc["_ingestion_date"] = datetime.now().date().isoformat()
 
-        table_uri = "s3://test-bucket/metrics_v1"
+        table_uri = f"{table_root}/metrics_v1"
         delta_writer.write_batch(table_uri, converted_docs)
 
         # Get initial schema
@@ -326,12 +283,11 @@ class TestSchemaEvolutionNewFields:
                 assert evolved_field.type == field.type or \
                        SchemaInferrer._types_compatible(field.type, evolved_field.type)
 
-    def test_concurrent_schema_evolution(self, mongodb_client, delta_writer, storage_options):
+    def test_concurrent_schema_evolution(self, test_db, table_root, delta_writer, storage_options):
         """Test handling multiple batches with different schemas."""
-        db = mongodb_client["test_db"]
-        collection = db["events"]
+        collection = test_db["events"]
 
-        table_uri = "s3://test-bucket/events_v1"
+        table_uri = f"{table_root}/events_v1"
 
         # Batch 1: Basic fields
         batch1 = [
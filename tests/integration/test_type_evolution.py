@@ -2,10 +2,6 @@
 
 import pytest
 from datetime import datetime
-from typing import Generator
-from testcontainers.mongodb import MongoDbContainer
-from testcontainers.minio import MinioContainer
-import pymongo
 import pyarrow as pa
 from deltalake import DeltaTable
 
@@ -14,43 +10,9 @@ from delta_writer.src.transformers.bson_to_delta import BSONToDeltaConverter
 
 
 @pytest.fixture(scope="module")
-def mongodb_container() -> Generator[MongoDbContainer, None, None]:
-    """Start MongoDB container for integration tests."""
-    container = MongoDbContainer("mongo:7.0")
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture(scope="module")
-def minio_container() -> Generator[MinioContainer, None, None]:
-    """Start MinIO container for integration tests."""
-    container = MinioContainer()
-    container.start()
-    yield container
-    container.stop()
-
-
-@pytest.fixture
-def mongodb_client(mongodb_container):
-    """Get MongoDB client."""
-    connection_url = mongodb_container.get_connection_url()
-    client = pymongo.MongoClient(connection_url)
-    yield client
-    client.close()
-
-
-@pytest.fixture
 def storage_options(minio_container):
     """Get MinIO storage options."""
-    return {
-        "AWS_ACCESS_KEY_ID": minio_container.access_key,
-        "AWS_SECRET_ACCESS_KEY": minio_container.secret_key,
-        "AWS_ENDPOINT_URL": minio_container.get_config()["endpoint"],
-        "AWS_ALLOW_HTTP": "true",
-        "AWS_REGION": "us-east-1",
-        "AWS_S3_ALLOW_UNSAFE_RENAME": "true"
-    }
+    return minio_container.get_storage_options()
 
 
 @pytest.fixture
@@ -62,10 +24,9 @@ def delta_writer(storage_options):
 class TestTypeEvolution:
     """Test type evolution and type widening."""
 
-    def test_int32_to_int64_widening(self, mongodb_client, delta_writer, storage_options):
+    def test_int32_to_int64_widening(self, test_db, table_root, delta_writer, storage_options):
         """Test automatic widening from int32 to int64."""
-        db = mongodb_client["test_db"]
-        collection = db["counters"]
+        collection = test_db["counters"]
 
         # Insert documents with int32 values (small integers)
         initial_docs = [
@@ -84,7 +45,7 @@ class TestTypeEvolution:
             doc["_kafka_topic"] = "test.counters"
             doc["_ingestion_date"] = datetime.now().date().isoformat()
 
-        table_uri = "s3://test-bucket/counters_v1"
+        table_uri = f"{table_root}/counters_v1"
         delta_writer.write_batch(table_uri, converted_docs)
 
         # Verify initial type is int32
@@ -122,10 +83,9 @@ class TestTypeEvolution:
         assert len(df) == 3
         assert df["counter"].tolist() == [100, 200, 9223372036854775807]
 
-    def test_int_to_float_widening(self, mongodb_client, delta_writer, storage_options):
+    def test_int_to_float_widening(self, test_db, table_root, delta_writer, storage_options):
         """Test automatic widening from int to float."""
-        db = mongodb_client["test_db"]
-        collection = db["measurements"]
+        collection = test_db["measurements"]
 
         # Insert documents with integer values
         initial_docs = [
@@ -144,7 +104,7 @@ class TestTypeEvolution:
             doc["_kafka_topic"] = "test.measurements"
             doc["_ingestion_date"] = datetime.now().date().isoformat()
 
-        table_uri = "s3://test-bucket/measurements_v1"
+        table_uri = f"{table_root}/measurements_v1"
         delta_writer.write_batch(table_uri, converted_docs)
 
         # Insert documents with float values
@@ -176,10 +136,9 @@ class TestTypeEvolution:
         df = table.to_pandas()
         assert len(df) == 4
 
-    def test_nested_struct_evolution(self, mongodb_client, delta_writer, storage_options):
+    def test_nested_struct_evolution(self, test_db, table_root, delta_writer, storage_options):
         """Test evolution of nested struct types."""
-        db = mongodb_client["test_db"]
-        collection = db["profiles"]
+        collection = test_db["profiles"]
 
         # Initial documents with simple nested structure
         initial_docs = [
@@ -202,7 +161,7 @@ class TestTypeEvolution:
             doc["_kafka_topic"] = "test.profiles"
             doc["_ingestion_date"] = datetime.now().date().isoformat()
 
-        table_uri = "s3://test-bucket/profiles_v1"
+        table_uri = f"{table_root}/profiles_v1"
         delta_writer.write_batch(table_uri, converted_docs)
 
         # Add document with expanded nested structure
@@ -253,10 +212,9 @@ class TestTypeEvolution:
         df = table.to_pandas()
         assert len(df) == 2
 
-    def test_list_type_evolution(self, mongodb_client, delta_writer, storage_options):
+    def test_list_type_evolution(self, test_db, table_root, delta_writer, storage_options):
         """Test evolution of list element types."""
-        db = mongodb_client["test_db"]
-        collection = db["arrays"]
+        collection = test_db["arrays"]
 
         # Initial documents with int list
         initial_docs = [
@@ -274,7 +232,7 @@ class TestTypeEvolution:
             doc["_kafka_topic"] = "test.arrays"
             doc["_ingestion_date"] = datetime.now().date().isoformat()
 
-        table_uri = "s3://test-bucket/arrays_v1"
+        table_uri = f"{table_root}/arrays_v1"
         delta_writer.write_batch(table_uri, converted_docs)
 
         # Verify initial list type
@@ -309,12 +267,11 @@ class TestTypeEvolution:
         assert pa.types.is_list(values_field.type)
         assert values_field.type.value_type == pa.int64()
 
-    def test_no_data_loss_during_type_evolution(self, mongodb_client, delta_writer, storage_options):
+    def test_no_data_loss_during_type_evolution(self, test_db, table_root, delta_writer, storage_options):
         """Test that no data is lost during type evolution."""
-        db = mongodb_client["test_db"]
-        collection = db["data_integrity"]
+        collection = test_db["data_integrity"]
 
-        table_uri = "s3://test-bucket/data_integrity_v1"
+        table_uri = f"{table_root}/data_integrity_v1"
         all_docs = []
 
         # Insert 50 documents with int32 values
@@ -373,12 +330,11 @@ class TestTypeEvolution:
         large_values = df[df["_id"] >= 50]["value"]
         assert large_values.min() >= 9223372036854775800
 
-    def test_type_evolution_with_100_plus_documents(self, mongodb_client, delta_writer, storage_options):
+    def test_type_evolution_with_100_plus_documents(self, test_db, table_root, delta_writer, storage_options):
         """Test type evolution with 100+ documents as per requirements."""
-        db = mongodb_client["test_db"]
-        collection = db["large_dataset"]
+        collection = test_db["large_dataset"]
 
-        table_uri = "s3://test-bucket/large_dataset_v1"
+        table_uri = f"{table_root}/large_dataset_v1"
 
         # Insert 100 documents with consistent int32 schema
         batch1 = []
@@ -455,10 +411,9 @@ class TestTypeEvolution:
         assert df["_id"].nunique() == 150
         assert df["category"].nunique() == 10
 
-    def test_multiple_type_changes_same_batch(self, mongodb_client, delta_writer, storage_options):
+    def test_multiple_type_changes_same_batch(self, test_db, table_root, delta_writer, storage_options):
         """Test multiple fields changing types in the same batch."""
-        db = mongodb_client["test_db"]
-        collection = db["multi_evolution"]
+        collection = test_db["multi_evolution"]
 
         # Initial documents
         initial_docs = [
@@ -481,7 +436,7 @@ class TestTypeEvolution:
             doc["_kafka_topic"] = "test.multi_evolution"
             doc["_ingestion_date"] = datetime.now().date().isoformat()
 
-        table_uri = "s3://test-bucket/multi_evolution_v1"
+        table_uri = f"{table_root}/multi_evolution_v1"
         delta_writer.write_batch(table_uri, converted_docs)
 
         # Document with multiple type changes
@@ -1,6 +1,7 @@
 """Testcontainers for integration testing."""
 
 from .containers import (
+    CDCComposeStack,
     MongoDBContainer,
     KafkaContainer,
     MinIOContainer,
@@ -10,6 +11,7 @@ from .containers import (
 )
 
 __all__ = [
+    "CDCComposeStack",
     "MongoDBContainer",
     "KafkaContainer",
     "MinIOContainer",
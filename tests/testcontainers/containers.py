@@ -1,11 +1,14 @@
 """Reusable Testcontainers configurations for integration tests.
 
-Provides pre-configured containers for MongoDB, Kafka, and MinIO.
+Provides pre-configured containers for MongoDB, Kafka, and MinIO, plus a
+docker-compose backed stack that starts all three in parallel.
 """
 
 import time
-from typing import Optional
+from pathlib import Path
+from typing import Dict, Optional
 
+from testcontainers.compose import DockerCompose
 from testcontainers.core.container import DockerContainer
 from testcontainers.core.waiting_utils import wait_for_logs
 from testcontainers.kafka import KafkaContainer as BaseKafkaContainer
@@ -141,6 +144,230 @@ class MinIOContainer(DockerContainer):
         return self
 
 
+class ComposeService:
+    """Handle to a single service running inside a DockerCompose stack."""
+
+    def __init__(self, compose: DockerCompose, service: str, port: int) -> None:
+        """Initialize service handle.
+
+        Args:
+            compose: Running DockerCompose instance
+            service: Service name in the compose file
+            port: Container port published by the service
+        """
+        self.compose = compose
+        self.service = service
+        self.port = port
+
+    def get_host(self) -> str:
+        """Get the host the service port is published on."""
+        return self.compose.get_service_host(self.service, self.port)
+
+    def get_port(self) -> int:
+        """Get the host port mapped to the service port."""
+        return int(self.compose.get_service_port(self.service, self.port))
+
+
+class ComposeMongoDB(ComposeService):
+    """MongoDB replica set member started from the compose stack."""
+
+    def __init__(self, compose: DockerCompose, replica_set: str = "rs0-test") -> None:
+        """Initialize MongoDB handle.
+
+        Args:
+            compose: Running DockerCompose instance
+            replica_set: Replica set name configured in the compose file
+        """
+        super().__init__(compose, "mongodb", 27017)
+        self.replica_set = replica_set
+
+    def get_connection_string(self) -> str:
+        """Get MongoDB connection string.
+
+        The replica set advertises ``localhost:27017``, so clients connect
+        directly to the published port instead of doing topology discovery.
+
+        Returns:
+            MongoDB connection string
+        """
+        return f"mongodb://{self.get_host()}:{self.get_port()}/?directConnection=true"
+
+    def wait_until_primary(self, timeout: float = 60.0) -> None:
+        """Block until the replica set member reports PRIMARY.
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        from pymongo import MongoClient
+
+        client = MongoClient(self.get_connection_string(), serverSelectionTimeoutMS=2000)
+        deadline = time.monotonic() + timeout
+        try:
+            while time.monotonic() < deadline:
+                try:
+                    if client.admin.command("hello").get("isWritablePrimary"):
+                        return
+                except Exception:
+                    pass
+                time.sleep(1)
+        finally:
+            client.close()
+        raise TimeoutError(f"MongoDB replica set {self.replica_set} not PRIMARY after {timeout}s")
+
+
+class ComposeKafka(ComposeService):
+    """Kafka broker started from the compose stack."""
+
+    def __init__(self, compose: DockerCompose) -> None:
+        """Initialize Kafka handle.
+
+        Args:
+            compose: Running DockerCompose instance
+        """
+        super().__init__(compose, "kafka", 29092)
+
+    def get_bootstrap_server(self) -> str:
+        """Get Kafka bootstrap server address.
+
+        Returns:
+            host:port of the externally advertised listener
+        """
+        return f"{self.get_host()}:{self.get_port()}"
+
+    def wait_until_ready(self, timeout: float = 60.0) -> None:
+        """Block until the broker answers metadata requests.
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        from kafka import KafkaAdminClient
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                admin = KafkaAdminClient(
+                    bootstrap_servers=self.get_bootstrap_server(),
+                    request_timeout_ms=2000,
+                )
+            except Exception:
+                time.sleep(1)
+                continue
+            try:
+                admin.list_topics()
+                return
+            except Exception:
+                time.sleep(1)
+            finally:
+                admin.close()
+        raise TimeoutError(f"Kafka broker not ready after {timeout}s")
+
+
+class ComposeMinIO(ComposeService):
+    """MinIO object store started from the compose stack."""
+
+    def __init__(
+        self,
+        compose: DockerCompose,
+        access_key: str = "minioadmin",
+        secret_key: str = "minioadmin",
+    ) -> None:
+        """Initialize MinIO handle.
+
+        Args:
+            compose: Running DockerCompose instance
+            access_key: MinIO access key
+            secret_key: MinIO secret key
+        """
+        super().__init__(compose, "minio", 9000)
+        self.access_key = access_key
+        self.secret_key = secret_key
+
+    def get_connection_url(self) -> str:
+        """Get MinIO connection URL.
+
+        Returns:
+            MinIO endpoint URL
+        """
+        return f"http://{self.get_host()}:{self.get_port()}"
+
+    def get_storage_options(self) -> Dict[str, str]:
+        """Get Delta Lake storage options for this MinIO instance.
+
+        Returns:
+            S3 storage options for deltalake
+        """
+        return {
+            "AWS_ENDPOINT_URL": self.get_connection_url(),
+            "AWS_ACCESS_KEY_ID": self.access_key,
+            "AWS_SECRET_ACCESS_KEY": self.secret_key,
+            "AWS_REGION": "us-east-1",
+            "AWS_S3_ALLOW_UNSAFE_RENAME": "true",
+            "AWS_ALLOW_HTTP": "true",
+        }
+
+    def wait_until_ready(self, timeout: float = 60.0) -> None:
+        """Block until MinIO's liveness endpoint reports healthy.
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        from urllib.error import URLError
+        from urllib.request import urlopen
+
+        url = f"{self.get_connection_url()}/minio/health/live"
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                with urlopen(url, timeout=2) as response:
+                    if response.status == 200:
+                        return
+            except (URLError, OSError):
+                pass
+            time.sleep(1)
+        raise TimeoutError(f"MinIO not ready after {timeout}s")
+
+
+class CDCComposeStack:
+    """MongoDB, Kafka and MinIO started together from one compose file.
+
+    ``docker compose up`` launches the services in parallel, so the stack
+    boots in roughly the time of the slowest service rather than the sum
+    of all three.
+    """
+
+    def __init__(
+        self,
+        compose_dir: Path,
+        compose_file_name: str = "compose.yaml",
+    ) -> None:
+        """Initialize compose stack.
+
+        Args:
+            compose_dir: Directory containing the compose file
+            compose_file_name: Compose file name
+        """
+        self.compose = DockerCompose(str(compose_dir), compose_file_name=compose_file_name)
+        self.mongodb = ComposeMongoDB(self.compose)
+        self.kafka = ComposeKafka(self.compose)
+        self.minio = ComposeMinIO(self.compose)
+
+    def start(self) -> "CDCComposeStack":
+        """Start all services and wait until each accepts connections.
+
+        Returns:
+            Started stack instance
+        """
+        self.compose.start()
+        self.mongodb.wait_until_primary()
+        self.kafka.wait_until_ready()
+        self.minio.wait_until_ready()
+        return self
+
+    def stop(self) -> None:
+        """Stop and remove all services."""
+        self.compose.stop()
+
+
 # Singleton container instances for test session
 _mongodb_container: Optional[MongoDBContainer] = None
 _kafka_container: Optional[KafkaContainer] = None
@@ -0,0 +1,163 @@
+"""Unit tests for DLQWriter serialization against a recording producer."""
+
+import base64
+import json
+
+import pytest
+from kafka.errors import KafkaError
+
+from delta_writer.src.writer import dlq_writer
+from delta_writer.src.writer.dlq_writer import (
+    DLQEvent,
+    DLQReason,
+    DLQWriter,
+    _serialize_value,
+    read_original_event,
+)
+
+
+RAW_EVENT = b"\xff\xfe\x00not-json"
+
+
+class RecordingProducer:
+    """Stands in for KafkaProducer, recording the serialized bytes it would send."""
+
+    def __init__(self, value_serializer, key_serializer, **config):
+        self.value_serializer = value_serializer
+        self.key_serializer = key_serializer
+        self.sent = []
+
+    def send(self, topic, value=None, key=None):
+        self.sent.append((topic, self.key_serializer(key), self.value_serializer(value)))
+
+
+class UnavailableProducer(RecordingProducer):
+    """Producer whose broker is down, so writes go to the fallback file."""
+
+    def send(self, topic, value=None, key=None):
+        raise KafkaError("broker unavailable")
+
+
+@pytest.fixture
+def writer(monkeypatch):
+    """DLQWriter whose lazily created producer records instead of sending."""
+    monkeypatch.setattr(dlq_writer, "KafkaProducer", RecordingProducer)
+    return DLQWriter(dlq_topic="cdc.dead_letter_queue", bootstrap_servers=["localhost:9092"])
+
+
+def make_event(original_event):
+    """DLQ event for a record from the users topic."""
+    return DLQEvent(
+        original_event=original_event,
+        reason=DLQReason.INVALID_BSON.value,
+        error_message="bad BSON",
+        timestamp="2025-11-27T10:00:00",
+        source_topic="mongodb.mydb.users",
+        partition=0,
+        offset=42,
+    )
+
+
+class TestSerializeValue:
+    """Test the producer's value serializer."""
+
+    def test_bytes_values_are_base64_encoded(self):
+        """Test raw bytes become a base64 string in the JSON payload."""
+        wire = _serialize_value({"original_event": RAW_EVENT, "reason": "invalid_bson"})
+
+        assert json.loads(wire) == {
+            "original_event": base64.b64encode(RAW_EVENT).decode("ascii"),
+            "reason": "invalid_bson",
+        }
+
+    def test_json_values_are_unchanged(self):
+        """Test JSON-native values serialize as plain UTF-8 JSON."""
+        payload = {"original_event": {"_id": "123", "name": "Zoë"}, "offset": 7}
+
+        assert _serialize_value(payload) == json.dumps(payload).encode("utf-8")
+
+    def test_unsupported_values_raise(self):
+        """Test values that are neither JSON nor bytes are rejected."""
+        with pytest.raises(TypeError, match="set"):
+            _serialize_value({"original_event": {1, 2}})
+
+
+class TestSendDict:
+    """Test sending prebuilt DLQ payloads."""
+
+    async def test_payload_is_serialized_by_producer(self, writer):
+        """Test send_dict hands the payload to the producer's serializers."""
+        await writer.send_dict(
+            "cdc.dead_letter_queue",
+            {"original_event": RAW_EVENT, "reason": "invalid_bson", "error_message": "bad BSON"},
+            key="mongodb.mydb.users:0:42",
+        )
+
+        [(topic, key, value)] = writer._producer.sent
+        assert topic == "cdc.dead_letter_queue"
+        assert key == b"mongodb.mydb.users:0:42"
+        assert json.loads(value) == {
+            "original_event": base64.b64encode(RAW_EVENT).decode("ascii"),
+            "reason": "invalid_bson",
+            "error_message": "bad BSON",
+        }
+        assert writer.get_metrics()["dlq_events_by_reason"] == {"invalid_bson": 1}
+
+    async def test_missing_reason_counts_as_unhandled(self, writer):
+        """Test payloads without a reason are counted as unhandled exceptions."""
+        await writer.send_dict("cdc.dead_letter_queue", {"original_event": {"_id": "1"}})
+
+        [(_, key, _)] = writer._producer.sent
+        assert key is None
+        assert writer.get_metrics()["dlq_events_by_reason"] == {"unhandled_exception": 1}
+
+
+class TestOriginalEventRoundTrip:
+    """Test recovering the original event from DLQ records."""
+
+    def test_bytes_event_round_trips_through_to_dict(self):
+        """Test raw bytes are stored as base64 and read back unchanged."""
+        record = make_event(RAW_EVENT).to_dict()
+
+        assert "original_event" not in record
+        assert record["original_event_b64"] == base64.b64encode(RAW_EVENT).decode("ascii")
+        assert read_original_event(record) == RAW_EVENT
+
+    def test_bytes_event_round_trips_through_to_json(self):
+        """Test the JSON form used by the fallback file keeps the raw bytes."""
+        record = json.loads(make_event(RAW_EVENT).to_json())
+
+        assert read_original_event(record) == RAW_EVENT
+
+    def test_decoded_event_is_stored_as_is(self):
+        """Test decoded events keep the original_event field."""
+        original = {"_id": "123", "name": "John Doe"}
+        record = json.loads(make_event(original).to_json())
+
+        assert "original_event_b64" not in record
+        assert read_original_event(record) == original
+
+    async def test_fallback_file_round_trip(self, monkeypatch, tmp_path):
+        """Test events written to the fallback file read back as raw bytes."""
+        monkeypatch.setattr(dlq_writer, "KafkaProducer", UnavailableProducer)
+        fallback_file = tmp_path / "dlq" / "fallback.jsonl"
+        writer = DLQWriter(
+            dlq_topic="cdc.dead_letter_queue",
+            bootstrap_servers=["localhost:9092"],
+            fallback_file=fallback_file,
+        )
+
+        await writer.write(
+            RAW_EVENT,
+            DLQReason.INVALID_BSON,
+            "bad BSON",
+            source_topic="mongodb.mydb.users",
+            partition=0,
+            offset=42,
+        )
+
+        [line] = fallback_file.read_text().splitlines()
+        record = json.loads(line)
+        assert read_original_event(record) == RAW_EVENT
+        assert record["offset"] == 42
+        assert writer.get_metrics()["fallback_writes"] == 1